@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+"""
+Pushes a lot of synthetic reminders through the notifications pipeline to measure
+its throughput and latency offline, without a live bot.
+
+Reminders are delivered by the file backend or by the webhook backend posting to
+a local stub server. For instance:
+
+    python -m benchmarks.bench_notifications --backend webhook --number 5000
+"""
+
+import argparse
+import asyncio
+import http.server
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from todozer import notifier
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Accepts every message, keeping a connection alive the same way a real server does.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+def get_measured_notifier(backend: str, target: str, **kwargs) -> notifier.Notifier:
+    """
+    Returns a notifier which remembers when every message is delivered.
+    """
+
+    notifier_class = (
+        notifier.WebhookNotifier if backend == "webhook" else notifier.FileNotifier
+    )
+
+    class MeasuredNotifier(notifier_class):
+        delivered_at = {}
+
+        def _deliver(self, message: str) -> None:
+            super()._deliver(message)
+
+            self.delivered_at[message] = time.perf_counter()
+
+    return MeasuredNotifier(target, **kwargs)
+
+
+async def push(sink: notifier.Notifier, number: int, batch_size: int) -> dict:
+    """
+    Sends reminders in batches, as if batch_size of them were due at once.
+    Returns the time every message is queued at.
+    """
+
+    queued_at = {}
+
+    async with sink:
+        for start in range(0, number, batch_size):
+            end = min(start + batch_size, number)
+            texts = [f"Reminder {index}" for index in range(start, end)]
+
+            for message in notifier.get_messages(texts, sink.max_message_length):
+                queued_at[message] = time.perf_counter()
+                sink.send(message)
+
+            await asyncio.sleep(0)
+
+        await sink.join()
+
+    return queued_at
+
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument("--backend", choices=["file", "webhook"], default="file")
+    arguments.add_argument("--number", type=int, default=5000)
+    arguments.add_argument("--batch-size", type=int, default=1)
+    arguments.add_argument("--concurrency", type=int, default=4)
+    options = arguments.parse_args()
+
+    server = None
+
+    if options.backend == "webhook":
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        target = f"http://127.0.0.1:{server.server_port}/"
+    else:
+        target = os.path.join(tempfile.mkdtemp(), "notifications.jsonl")
+
+    sink = get_measured_notifier(
+        options.backend,
+        target,
+        concurrency=options.concurrency,
+        max_message_length=notifier.TELEGRAM_MAX_MESSAGE_LENGTH,
+    )
+
+    started_at = time.perf_counter()
+    queued_at = asyncio.run(push(sink, options.number, options.batch_size))
+    elapsed = time.perf_counter() - started_at
+
+    if server is not None:
+        server.shutdown()
+
+    latencies = sorted(
+        sink.delivered_at[message] - queued_at[message] for message in queued_at
+    )
+
+    print(f"Backend:    {options.backend}")
+    print(f"Reminders:  {options.number} in {len(queued_at)} messages")
+    print(f"Total time: {elapsed:.3f} s")
+    print(f"Throughput: {options.number / elapsed:.0f} reminders/s")
+    print(f"Latency:    median {statistics.median(latencies) * 1000:.2f} ms, ", end="")
+    print(f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+"""
+Measures how long it takes to load & save the app's state file depending on its size,
+using the pure Python YAML implementation and the libyaml based one (if available).
+For instance:
+
+    python -m benchmarks.bench_state_file --days 30 90 365
+"""
+
+import argparse
+import datetime
+import os
+import tempfile
+import timeit
+
+import yaml
+
+from todozer import state_file
+
+
+def get_state(days_number: int, tasks_number: int) -> dict:
+    """
+    Returns a state with notifications triggered for a number of days.
+    """
+
+    state = state_file.get_data_by_default()
+    date = datetime.date(2023, 1, 1)
+
+    for _ in range(days_number):
+        date_string = date.isoformat()
+
+        for index in range(tasks_number):
+            for time_string in ("09:00", "13:30", "18:45"):
+                state_file.add_triggered_notification(
+                    state, date_string, f"- [ ] Task {index}", time_string
+                )
+
+        date += datetime.timedelta(days=1)
+
+    return state
+
+
+def measure(file_name: str, state: dict, loader, dumper, number: int) -> tuple:
+    def save():
+        with open(file_name, "w", encoding="utf-8") as file:
+            yaml.dump(state, file, Dumper=dumper)
+
+    def load():
+        with open(file_name, encoding="utf-8") as file:
+            yaml.load(file, Loader=loader)
+
+    save_time = timeit.timeit(save, number=number) / number
+    load_time = timeit.timeit(load, number=number) / number
+
+    return load_time, save_time
+
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument("--days", type=int, nargs="+", default=[7, 30, 90, 365])
+    arguments.add_argument("--tasks", type=int, default=10)
+    arguments.add_argument("--number", type=int, default=5)
+    options = arguments.parse_args()
+
+    implementations = [("python", yaml.SafeLoader, yaml.SafeDumper)]
+
+    if state_file.SafeLoader is not yaml.SafeLoader:
+        implementations.append(
+            ("libyaml", state_file.SafeLoader, state_file.SafeDumper)
+        )
+
+    file_name = os.path.join(tempfile.mkdtemp(), "todozer.dat")
+
+    print(f"{'days':>6} {'size, KB':>9}", end="")
+
+    for name, _, _ in implementations:
+        print(f" {name + ' load, ms':>18} {name + ' save, ms':>18}", end="")
+
+    print()
+
+    for days_number in options.days:
+        state = get_state(days_number, options.tasks)
+        results = []
+
+        for _, loader, dumper in implementations:
+            results += measure(file_name, state, loader, dumper, options.number)
+
+        size = os.path.getsize(file_name) / 1024
+
+        print(f"{days_number:>6} {size:>9.1f}", end="")
+
+        for result in results:
+            print(f" {result * 1000:>18.2f}", end="")
+
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+"""
+Measures how long the app's main procedures take on synthetic data files of several sizes:
+parsing, matching plans, filling task lists, saving the tasks file and showing tasks.
+
+Results may be saved as JSON and compared with the ones saved before, so regressions
+are visible over time. For instance:
+
+    python -m benchmarks.bench_suite --lines 1000 100000 --output after.json --baseline before.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks import generators
+from todozer import parser, plan_calendar, scheduler, state_file, task_lists, utils
+from todozer.commands import command_show
+from todozer.todo import plan_todo, task_todo
+
+
+def measure(
+    function: Callable[[object], object],
+    setup: Callable[[], object] | None,
+    number: int,
+) -> dict:
+    """
+    Calls a function several times, passing it a result of the setup function,
+    which is called before every call and is not measured. Returns the best
+    and the median time of a call, in seconds.
+    """
+
+    times = []
+
+    for _ in range(number):
+        argument = setup() if setup is not None else None
+
+        started_at = time.perf_counter()
+        function(argument)
+        times.append(time.perf_counter() - started_at)
+
+    return {"min": min(times), "median": statistics.median(times)}
+
+
+def get_cases(path: str, today: datetime.date, show_days: list[int]) -> dict:
+    """
+    Returns benchmark cases by their names: pairs of a function to measure
+    and a function to prepare its argument.
+    """
+
+    config = utils.get_config(path)
+    tasks_file_name = os.path.join(path, "tasks.md")
+    plans_file_name = os.path.join(path, "plans.md")
+    dates = [today + datetime.timedelta(days=n) for n in range(365)]
+
+    def parse_plans(_=None) -> list:
+        return parser.Parser(plans_file_name, plan_todo.PlanTodo).parse()
+
+    def match(plans_file_items: list) -> None:
+        for plans_file_item in plans_file_items:
+            for plan in plans_file_item.items:
+                for date in dates:
+                    scheduler.match(plan, date)
+
+    def load_to_fill():
+        state = state_file.load(path)
+        state["last_planning_date"] = today - datetime.timedelta(days=30)
+
+        return task_lists.load_tasks_file_items(config, path), parse_plans(), state
+
+    def fill(arguments) -> None:
+        tasks, plans_file_items, state = arguments
+        plans = plan_calendar.PlanCalendar(plans_file_items)
+
+        task_lists.fill_tasks_lists(tasks, plans, state)
+
+    def load_to_save():
+        arguments = load_to_fill()
+        fill(arguments)
+
+        return arguments[0]
+
+    cases = {
+        "parse tasks": (
+            lambda _: parser.Parser(tasks_file_name, task_todo.TaskTodo).parse(),
+            None,
+        ),
+        "parse plans": (parse_plans, None),
+        "match plans for 365 days": (match, parse_plans),
+        "fill tasks lists for 30 days": (fill, load_to_fill),
+        "save tasks file": (
+            lambda tasks: task_lists.save_tasks_file_items(tasks, config, path),
+            load_to_save,
+        ),
+    }
+
+    for days_number in show_days:
+        cases[f"show last {days_number} days"] = (
+            lambda _, value=str(days_number): __show("last", value, path),
+            None,
+        )
+
+    return cases
+
+
+def __show(period: str, value: str, path: str) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        command_show.main(period, value, path, False, False)
+
+
+def run(options) -> list[dict]:
+    """
+    Runs all the benchmark cases for every size of the tasks file.
+    """
+
+    today = utils.get_date_of_today()
+    results = []
+
+    for lines_number in options.lines:
+        with tempfile.TemporaryDirectory() as path:
+            generators.make_working_directory(path, lines_number, options.plans, today)
+
+            cases = get_cases(path, today, options.show_days)
+
+            for name, (function, setup) in cases.items():
+                result = measure(function, setup, options.number)
+
+                results.append(
+                    {
+                        "case": name,
+                        "lines": lines_number,
+                        "plans": options.plans,
+                        **result,
+                    }
+                )
+
+                __print_result(results[-1], options.baseline_results)
+
+    return results
+
+
+def load_results(file_name: str | None) -> dict:
+    """
+    Returns results saved before by their cases and sizes.
+    """
+
+    if file_name is None:
+        return {}
+
+    with open(file_name, encoding="utf-8") as file:
+        data = json.load(file)
+
+    return {
+        (result["case"], result["lines"], result["plans"]): result
+        for result in data["results"]
+    }
+
+
+def __print_result(result: dict, baseline_results: dict) -> None:
+    print(
+        f"{result['case']:<30} {result['lines']:>9} {result['plans']:>6}"
+        f" {result['min'] * 1000:>12.2f} {result['median'] * 1000:>12.2f}",
+        end="",
+    )
+
+    baseline = baseline_results.get((result["case"], result["lines"], result["plans"]))
+
+    if baseline is not None:
+        print(f" {(result['min'] / baseline['min'] - 1) * 100:>+9.1f}%", end="")
+
+    print(flush=True)
+
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument(
+        "--lines", type=int, nargs="+", default=[1000, 10000, 100000]
+    )
+    arguments.add_argument("--plans", type=int, default=300)
+    arguments.add_argument("--show-days", type=int, nargs="+", default=[1, 30])
+    arguments.add_argument("--number", type=int, default=5)
+    arguments.add_argument("--output", help="Save results to a JSON file.")
+    arguments.add_argument("--baseline", help="Compare with results saved before.")
+    options = arguments.parse_args()
+
+    options.baseline_results = load_results(options.baseline)
+
+    print(
+        f"{'case':<30} {'lines':>9} {'plans':>6} {'min, ms':>12} {'median, ms':>12}",
+        end="",
+    )
+    print(f" {'change':>10}" if options.baseline_results else "")
+
+    results = run(options)
+
+    if options.output is not None:
+        data = {
+            "time": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+
+        with open(options.output, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+"""
+Generates synthetic data files of any size for benchmarks: a tasks file with task lists
+for consecutive days and a plans file with plans of all the patterns the app supports.
+"""
+
+import datetime
+import os
+import random
+
+from todozer import constants, state_file, utils
+
+# Patterns of plans, in English and in Russian; "{date}" is replaced with a date.
+PLAN_PATTERNS = [
+    "every day",
+    "каждый день",
+    "every 3 days from {date}",
+    "каждые 10 дней с {date}",
+    "every weekday",
+    "по будням",
+    "every Monday",
+    "every 2 Wednesday from {date}",
+    "каждую пятницу",
+    "every month, day 5",
+    "every month, last day",
+    "каждый месяц, 15 день",
+    "every year, December 31",
+    "every year, Feb 29",
+    "{date}",
+]
+
+
+def get_tasks_file_text(lines_number: int, last_date: datetime.date) -> str:
+    """
+    Returns a tasks file of about a given number of lines: task lists for days
+    up to the last date, in ascending order, each one with 5 to 15 tasks
+    (some of them with times, notes and logged time).
+    """
+
+    randomizer = random.Random(lines_number)
+    days = []
+    count = 0
+    date = last_date
+
+    while count < lines_number:
+        lines = [f"# {utils.get_string_from_date(date)}", ""]
+
+        for index in range(randomizer.randint(5, 15)):
+            mark = "x" if randomizer.random() < 0.8 else " "
+            time_string = (
+                f"{randomizer.randint(8, 21):02}:00 " if index % 3 == 0 else ""
+            )
+
+            lines.append(f"- [{mark}] {time_string}Task {index} of the day")
+
+            if index % 4 == 0:
+                lines.append(f"    notify at {randomizer.randint(8, 21):02}:30")
+
+            if index % 5 == 0:
+                lines.append("    Some notes on the task")
+
+        days.append("\n".join(lines))
+        count += len(lines) + 1
+        date -= datetime.timedelta(days=1)
+
+    return "\n\n".join(reversed(days)) + "\n"
+
+
+def get_plans_file_text(plans_number: int, start_date: datetime.date) -> str:
+    """
+    Returns a plans file of a given number of plans of mixed patterns,
+    grouped in sections of 20 plans.
+    """
+
+    date_string = utils.get_string_from_date(start_date)
+    lines = []
+
+    for index in range(plans_number):
+        if index % 20 == 0:
+            if lines:
+                lines.append("")
+
+            lines += [f"# Plans {index // 20 + 1}", ""]
+
+        pattern = PLAN_PATTERNS[index % len(PLAN_PATTERNS)]
+        pattern = pattern.replace("{date}", date_string)
+
+        lines.append(f"- [ ] Plan {index}; {pattern}")
+
+        if index % 7 == 0:
+            lines.append("    notify at 10:00")
+
+    return "\n".join(lines) + "\n"
+
+
+def make_working_directory(
+    path: str, lines_number: int, plans_number: int, today: datetime.date
+) -> None:
+    """
+    Writes data files of the app to a directory: the tasks file with days up to today,
+    the plans file and the app's state, as if tasks were planned till yesterday.
+    """
+
+    start_date = today - datetime.timedelta(days=365)
+
+    with open(os.path.join(path, "tasks.md"), "w", encoding=constants.ENCODING) as file:
+        file.write(get_tasks_file_text(lines_number, today))
+
+    with open(os.path.join(path, "plans.md"), "w", encoding=constants.ENCODING) as file:
+        file.write(get_plans_file_text(plans_number, start_date))
+
+    state = state_file.get_data_by_default()
+    state["last_planning_date"] = today - datetime.timedelta(days=1)
+
+    state_file.save(path, state)
@@ -19,6 +19,7 @@ setup(
         "click==8.1.7",
         "pyyaml==6.0.1",
     ],
+    extras_require={"numpy": ["numpy"]},
     entry_points={"console_scripts": ["todozer=todozer.app:cli"]},
     author="Vlad Kostyanetsky",
     author_email="vlad@kostyanetsky.me",
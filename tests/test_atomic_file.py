@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+from todozer import atomic_file
+
+
+def test_open_for_writing(tmp_path):
+    file_path = tmp_path / "tasks.md"
+    file_path.write_text("old")
+    os.chmod(file_path, 0o640)
+
+    link_path = tmp_path / "link.md"
+    link_path.symlink_to(file_path)
+
+    with pytest.raises(RuntimeError):
+        with atomic_file.open_for_writing(link_path) as file:
+            file.write("partial")
+            raise RuntimeError
+
+    assert file_path.read_text() == "old"
+    assert sorted(os.listdir(tmp_path)) == ["link.md", "tasks.md"]
+
+    backup_path = tmp_path / "tasks.md.bak"
+
+    with atomic_file.open_for_writing(link_path, backup_file_name=backup_path) as file:
+        file.write("new")
+
+    assert link_path.is_symlink()
+    assert file_path.read_text() == "new"
+    assert backup_path.read_text() == "old"
+    assert os.stat(file_path).st_mode & 0o777 == 0o640
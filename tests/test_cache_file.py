@@ -0,0 +1,60 @@
+import json
+import os
+import pickle
+import time
+
+from todozer import cache_file
+
+
+def test_cache_file(tmp_path):
+    file_path = tmp_path / "tasks.md"
+    file_path.write_text("# 2023-07-01")
+
+    builds = []
+
+    def build(data: bytes) -> str:
+        builds.append(data)
+        return data.decode()
+
+    assert cache_file.get(tmp_path, file_path, build) == "# 2023-07-01"
+    assert cache_file.get(tmp_path, file_path, build) == "# 2023-07-01"
+    assert len(builds) == 1
+
+    # The same content with another modification time is not rebuilt.
+    os.utime(file_path, ns=(0, 0))
+
+    assert cache_file.get(tmp_path, file_path, build) == "# 2023-07-01"
+    assert len(builds) == 1
+
+    # Changed content of the same size is rebuilt.
+    file_path.write_text("# 2023-07-02")
+    os.utime(file_path, ns=(1, 1))
+
+    assert cache_file.get(tmp_path, file_path, build) == "# 2023-07-02"
+    assert len(builds) == 2
+
+    # A file rewritten with the same size within the same tick of its modification
+    # time (which is possible, since it was read soon after it was modified) is rebuilt.
+    mtime_ns = time.time_ns()
+    os.utime(file_path, ns=(mtime_ns, mtime_ns))
+
+    assert cache_file.get(tmp_path, file_path, build) == "# 2023-07-02"
+
+    file_path.write_text("# 2023-07-04")
+    os.utime(file_path, ns=(mtime_ns, mtime_ns))
+
+    assert cache_file.get(tmp_path, file_path, build) == "# 2023-07-04"
+    assert len(builds) == 3
+
+    # The cache is plain JSON data.
+    cache = json.loads((tmp_path / "todozer.cache").read_text())
+
+    assert cache["files"][str(file_path)][3] == "# 2023-07-04"
+
+    # A corrupt cache (or a cache of another format) is ignored.
+    for data in [b"garbage", pickle.dumps(cache), b"[]", b'{"format": 3}']:
+        (tmp_path / "todozer.cache").write_bytes(data)
+
+        assert cache_file.get(tmp_path, file_path, build) == "# 2023-07-04"
+
+    assert len(builds) == 7
@@ -0,0 +1,83 @@
+import datetime
+import heapq
+
+from todozer import state_file
+from todozer.commands import command_beep
+from todozer.todo.task_todo import TaskTodo
+
+NOW = datetime.datetime(2023, 7, 2, 10, 0)
+
+
+class StubNotifier:
+    def __init__(self):
+        self.messages = []
+
+    def send_all(self, texts: list[str]) -> None:
+        self.messages.append(texts)
+
+
+def get_schedule(minutes_by_titles: dict[str, int]) -> list[tuple]:
+    schedule = []
+
+    for title, minutes in minutes_by_titles.items():
+        remind_at = NOW + datetime.timedelta(minutes=minutes)
+        notification = {
+            "date": remind_at.date(),
+            "time": remind_at.time(),
+            "task": TaskTodo(f"- [ ] {title}"),
+        }
+
+        heapq.heappush(schedule, (remind_at, len(schedule), notification))
+
+    return schedule
+
+
+def test_send_due_notifications():
+    schedule = get_schedule({"Later": 30, "Now": 0, "Late": -60, "Soon": 1})
+    backend_notifier = StubNotifier()
+    state = state_file.get_data_by_default()
+
+    notifications = command_beep.send_due_notifications(
+        schedule, backend_notifier, state, NOW
+    )
+
+    # Due notifications are sent at once, in order of their times.
+    assert notifications == [
+        ("2023-07-02", "- [ ] Late", "09:00"),
+        ("2023-07-02", "- [ ] Now", "10:00"),
+    ]
+    assert backend_notifier.messages == [["Late", "Now"]]
+
+    # The rest are kept in the schedule, the earliest one is the first.
+    assert [notification["task"].title for _, _, notification in schedule] == [
+        "Soon",
+        "Later",
+    ]
+
+    # Notifications triggered already are not sent again.
+    schedule = get_schedule({"Late": -60, "Soon": 1})
+    backend_notifier = StubNotifier()
+    now = NOW + datetime.timedelta(minutes=1)
+
+    notifications = command_beep.send_due_notifications(
+        schedule, backend_notifier, state, now
+    )
+
+    assert notifications == [("2023-07-02", "- [ ] Soon", "10:01")]
+    assert backend_notifier.messages == [["Soon"]]
+    assert schedule == []
+
+
+def test_get_seconds_to_wait():
+    schedule = get_schedule({"Soon": 15})
+
+    assert command_beep.get_seconds_to_wait(schedule, NOW) == 15 * 60
+    assert command_beep.get_seconds_to_wait(get_schedule({"Late": -1}), NOW) == 0
+
+    # It never waits longer than an hour, or than until midnight.
+    assert command_beep.get_seconds_to_wait([], NOW) == 60 * 60
+    assert command_beep.get_seconds_to_wait(get_schedule({"Later": 120}), NOW) == 3600
+
+    before_midnight = datetime.datetime(2023, 7, 2, 23, 50)
+
+    assert command_beep.get_seconds_to_wait([], before_midnight) == 10 * 60
@@ -0,0 +1,107 @@
+import contextlib
+import datetime
+import os
+
+import click
+import click.utils
+import pytest
+
+from todozer import echo, state_file, task_lists, utils
+from todozer.commands import command_show
+
+
+def make_working_directory(path) -> None:
+    today = utils.get_date_of_today()
+    tomorrow = utils.get_string_from_date(today + datetime.timedelta(days=1))
+
+    (path / "tasks.md").write_text(
+        f"# {tomorrow}\n\n- [ ] 10:00 Call mom\n    notify at 09:50\n- [x] Buy milk\n",
+        encoding="utf-8",
+    )
+    (path / "plans.md").write_text(
+        "# Plans\n\n- [ ] Daily; every day\n- [ ] Weekly; every Monday\n",
+        encoding="utf-8",
+    )
+
+    state = state_file.get_data_by_default()
+    state["last_planning_date"] = today
+
+    state_file.save(path, state)
+
+
+def get_snapshot(tasks) -> list:
+    return [
+        (id(tasks_list), str(tasks_list), [id(task) for task in tasks_list.items])
+        for tasks_list in tasks
+    ]
+
+
+def test_show_keeps_tasks_lists(tmp_path, capsys, monkeypatch):
+    make_working_directory(tmp_path)
+
+    loaded = []
+    load_tasks_file_lists = task_lists.load_tasks_file_lists
+
+    def load(*args):
+        tasks = load_tasks_file_lists(*args)
+        loaded.append((tasks, get_snapshot(tasks)))
+
+        return tasks
+
+    monkeypatch.setattr(task_lists, "load_tasks_file_lists", load)
+
+    command_show.main("next", "3", tmp_path, False, False)
+
+    tasks, snapshot = loaded[0]
+
+    # Planned tasks are shown, but not added to the task lists loaded.
+    assert "Daily" in capsys.readouterr().out
+    assert len(tasks) == 1
+    assert get_snapshot(tasks) == snapshot
+
+
+def test_show_output(tmp_path, capsys, monkeypatch):
+    make_working_directory(tmp_path)
+
+    # Styles are kept in the output captured, so they are compared as well.
+    monkeypatch.setattr(click.utils, "should_strip_ansi", lambda *args: False)
+
+    command_show.main("next", "3", tmp_path, False, True)
+    buffered_output = capsys.readouterr().out
+
+    pager_texts = []
+    monkeypatch.setattr(click, "echo_via_pager", pager_texts.append)
+
+    command_show.main("next", "3", tmp_path, False, True, pager=True)
+
+    @contextlib.contextmanager
+    def unbuffered(pager: bool = False):
+        yield
+
+    monkeypatch.setattr(echo, "buffered", unbuffered)
+
+    command_show.main("next", "3", tmp_path, False, True)
+    output = capsys.readouterr().out
+
+    assert "\x1b[" in output
+    assert buffered_output == output
+    assert pager_texts == [output]
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="permissions of a directory are not checked for the superuser",
+)
+def test_show_in_read_only_directory(tmp_path, capsys):
+    make_working_directory(tmp_path)
+    files = sorted(os.listdir(tmp_path))
+
+    tmp_path.chmod(0o555)
+
+    try:
+        command_show.main("next", "3", tmp_path, False, False)
+    finally:
+        tmp_path.chmod(0o755)
+
+    assert "Call mom" in capsys.readouterr().out
+    assert sorted(os.listdir(tmp_path)) == files
@@ -0,0 +1,90 @@
+import datetime
+import os
+
+from todozer import utils
+from todozer.commands import command_test
+
+PLANS = """# Plans
+
+- [ ] Daily; every day
+- [ ] Weekdays; every weekday
+- [ ] Feb 30; every year, Feb 30
+- [ ] Past; 2020-01-01
+- [ ] Every other day; every 2 days from 2024-01-01
+- [ ] Weekly; every Monday
+- [ ] Odd; something odd
+- [ ] Day 32; every month, day 32
+"""
+
+ISSUES = [
+    '- Unable to plan task "Odd" using pattern "something odd"',
+    '- Task "Feb 30" is never planned in the next 365 days',
+    '- Task "Past" is planned for a date in the past',
+    '- Task "Day 32" is never planned in the next 365 days',
+]
+
+
+def get_issues(output: str) -> list[str]:
+    return [line for line in output.splitlines() if line.startswith("- ")]
+
+
+def test_horizon(tmp_path, capsys):
+    (tmp_path / "plans.md").write_text(PLANS, encoding="utf-8")
+
+    command_test.main(tmp_path)
+    assert get_issues(capsys.readouterr().out) == ISSUES[:1]
+
+    command_test.main(tmp_path, horizon=365)
+    assert get_issues(capsys.readouterr().out) == ISSUES
+
+
+def test_horizon_in_parallel(tmp_path, capsys, monkeypatch):
+    (tmp_path / "plans.md").write_text(PLANS, encoding="utf-8")
+
+    monkeypatch.setattr(command_test, "PARALLEL_PLANS_NUMBER", 1)
+    monkeypatch.setattr(os, "cpu_count", lambda: 3)
+
+    command_test.main(tmp_path, horizon=365)
+    assert get_issues(capsys.readouterr().out) == ISSUES
+
+
+def test_horizon_shorter_than_patterns(tmp_path, capsys):
+    (tmp_path / "plans.md").write_text(PLANS, encoding="utf-8")
+
+    # Only plans which can never be planned are reported, whatever the horizon is.
+    command_test.main(tmp_path, horizon=1)
+    assert get_issues(capsys.readouterr().out) == [
+        issue.replace("next 365 days", "next 1 days") for issue in ISSUES
+    ]
+
+
+def test_horizon_density():
+    today = utils.get_date_of_today()
+    end = today + datetime.timedelta(days=364)
+    plans_lines = [
+        [
+            f"- [ ] Every other day; every 2 days from {utils.get_string_from_date(today)}"
+        ],
+        ["- [ ] Monthly; every month, day 5"],
+    ]
+
+    assert command_test.get_horizon_issues(plans_lines, today, end) == []
+
+
+def test_horizon_duplicates(tmp_path, capsys):
+    plans = [
+        "# Plans",
+        "",
+        "- [ ] Report; every day",
+        "- [ ] Report; every Monday",
+        "- [ ] Meeting; every Tuesday",
+        "- [ ] Meeting; every Wednesday",
+    ]
+
+    (tmp_path / "plans.md").write_text("\n".join(plans) + "\n", encoding="utf-8")
+
+    # The report is planned twice every Monday, the meeting is never planned twice.
+    command_test.main(tmp_path, horizon=14)
+    assert get_issues(capsys.readouterr().out) == [
+        '- Task "Report" is planned more than once on 2 of the next 14 days'
+    ]
@@ -0,0 +1,117 @@
+import re
+
+from todozer import scheduler
+
+PATTERNS_EN = [
+    "every day",
+    "every 1 day",
+    "every 3 days",
+    "every 10 days",
+    "every weekday",
+    "every Monday",
+    "every 2 monday",
+    "every 3 Friday",
+    "every 2 Wednesday",
+    "every month, day 5",
+    "every month, day 31",
+    "every month, 15 day",
+    "every month, last day",
+    "every year, 4 July",
+    "every year, December 31",
+    "every year, Feb 29",
+    "2024-02-29",
+]
+
+PATTERNS_RU = [
+    "каждый день",
+    "каждые 3 дня",
+    "каждые 10 дней",
+    "каждый будний день",
+    "по будням",
+    "по будним дням",
+    "каждый понедельник",
+    "каждый 2 вторник",
+    "каждую среду",
+    "каждую 2 среду",
+    "каждый четверг",
+    "каждую пятницу",
+    "каждую 2 субботу",
+    "каждое воскресенье",
+    "каждое 2 воскресенье",
+    "каждый месяц, 5 день",
+    "каждый месяц, последний день",
+]
+
+MONTHS_EN = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+MONTHS_RU = [
+    "января",
+    "февраля",
+    "марта",
+    "апреля",
+    "мая",
+    "июня",
+    "июля",
+    "августа",
+    "сентября",
+    "октября",
+    "ноября",
+    "декабря",
+]
+
+
+def get_compiled_pattern_sequentially(text: str) -> str:
+    """
+    The previous implementation: a regular expression per rule, applied one by one.
+    """
+
+    for words, translation in scheduler.TRANSLATION_RULES:
+        text = re.sub(
+            rf"(.*)({words})(.*)", rf"\1{translation}\3", text, flags=re.IGNORECASE
+        )
+
+    return text.strip()
+
+
+def get_samples() -> list[str]:
+    samples = PATTERNS_EN + PATTERNS_RU
+    samples += [f"every year, {month} 17" for month in MONTHS_EN]
+    samples += [f"every year, 17 {month}" for month in MONTHS_EN]
+    samples += [f"каждый год, 17 {month}" for month in MONTHS_RU]
+
+    samples += [f"{sample} from 2024-01-05" for sample in PATTERNS_EN]
+    samples += [f"{sample} с 2024-01-05" for sample in PATTERNS_RU]
+
+    return samples
+
+
+def test_compiled_pattern():
+    for sample in get_samples():
+        expected = get_compiled_pattern_sequentially(sample)
+
+        # The previous implementation replaced a part of a longer word, so "марта"
+        # became "mar" with the Cyrillic "а" left, while the month was recognized
+        # all the same.
+        expected = re.sub("(mar|aug)а", r"\1", expected)
+
+        assert scheduler.get_compiled_pattern(sample) == expected, sample
+
+
+def test_compiled_pattern_case():
+    assert scheduler.get_compiled_pattern("Каждый ПОНЕДЕЛЬНИК ") == "every monday"
+    assert scheduler.get_compiled_pattern("каждые 2 дня, каждые 3 дня") == (
+        "every 2 days, every 3 days"
+    )
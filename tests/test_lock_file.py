@@ -0,0 +1,23 @@
+import threading
+import time
+
+from todozer import lock_file
+
+
+def test_lock(tmp_path):
+    events = []
+
+    def write():
+        with lock_file.lock(tmp_path):
+            events.append("write")
+
+    with lock_file.lock(tmp_path, shared=True):
+        writer = threading.Thread(target=write)
+        writer.start()
+
+        time.sleep(0.2)
+        events.append("read")
+
+    writer.join()
+
+    assert events == ["read", "write"]
@@ -0,0 +1,194 @@
+import asyncio
+import http.server
+import json
+import threading
+import time
+import urllib.parse
+
+import pytest
+
+from todozer import notifier
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers like Telegram does, but slowly for the "slow" message and with an error
+    for the first attempt to send the "flaky" one.
+    """
+
+    received = []
+
+    def do_POST(self):
+        query = urllib.parse.urlparse(self.path).query
+        text = urllib.parse.parse_qs(query)["text"][0]
+
+        attempts = self.received.count(text)
+        self.received.append(text)
+
+        if text == "slow":
+            time.sleep(1)
+
+        status = 500 if text == "flaky" and attempts == 0 else 200
+
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_telegram_notifier():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    api_url = f"http://127.0.0.1:{server.server_port}"
+    elapsed = {}
+
+    async def send():
+        telegram_notifier = notifier.TelegramNotifier(
+            "token", "chat", api_url=api_url, backoff=0.01
+        )
+
+        async with telegram_notifier:
+            started_at = time.monotonic()
+
+            telegram_notifier.send("slow")
+            telegram_notifier.send("flaky")
+            telegram_notifier.send("fast")
+
+            while len(StubHandler.received) < 4:
+                await asyncio.sleep(0.01)
+
+            elapsed["fast"] = time.monotonic() - started_at
+
+            await telegram_notifier.join()
+
+    try:
+        asyncio.run(send())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert sorted(StubHandler.received) == ["fast", "flaky", "flaky", "slow"]
+    assert elapsed["fast"] < 1
+
+
+class BusyHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers like Telegram does when a bot sends too many messages,
+    but only for the first attempt.
+    """
+
+    times = []
+
+    def do_POST(self):
+        self.times.append(time.monotonic())
+
+        if len(self.times) == 1:
+            status = 429
+            body = json.dumps({"ok": False, "parameters": {"retry_after": 0.5}})
+        else:
+            status = 200
+            body = "{}"
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+def test_telegram_notifier_retry_after():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), BusyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    api_url = f"http://127.0.0.1:{server.server_port}"
+
+    async def send():
+        async with notifier.TelegramNotifier(
+            "token", "chat", api_url=api_url, backoff=0.01
+        ) as telegram_notifier:
+            telegram_notifier.send("Take a pill")
+
+    try:
+        asyncio.run(send())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # The notifier waits as long as it is asked to, not the backoff time,
+    # and the message is delivered before the notifier is exited.
+    assert len(BusyHandler.times) == 2
+    assert BusyHandler.times[1] - BusyHandler.times[0] >= 0.5
+
+
+def test_get_messages():
+    texts = ["Take a pill", "Call mom", "x" * 25, "Go for a walk"]
+
+    assert notifier.get_messages(texts, 100) == ["\n".join(texts)]
+    assert notifier.get_messages(texts, 20) == [
+        "Take a pill\nCall mom",
+        "x" * 20,
+        "xxxxx\nGo for a walk",
+    ]
+    assert notifier.get_messages([], 20) == []
+
+
+def test_file_notifier(tmp_path):
+    file_path = tmp_path / "notifications.jsonl"
+
+    async def send():
+        async with notifier.FileNotifier(file_path, max_message_length=20) as sink:
+            sink.send_all(["Take a pill", "Call mom", "Go for a walk"])
+
+            await sink.join()
+
+    asyncio.run(send())
+
+    lines = file_path.read_text().splitlines()
+    texts = [json.loads(line)["text"] for line in lines]
+
+    assert texts == ["Take a pill\nCall mom", "Go for a walk"]
+
+
+def test_notifier_drains_queue(tmp_path):
+    file_path = tmp_path / "notifications.jsonl"
+
+    async def send():
+        async with notifier.FileNotifier(file_path) as sink:
+            sink.send_all(["Take a pill"])
+            sink.send_all(["Call mom"])
+
+    asyncio.run(send())
+
+    lines = file_path.read_text().splitlines()
+
+    assert [json.loads(line)["text"] for line in lines] == ["Take a pill", "Call mom"]
+
+
+def test_desktop_command():
+    message = 'Купить молоко\n"2%" \\ К'
+
+    assert notifier.get_desktop_command(message, "darwin") == [
+        "osascript",
+        "-e",
+        "on run argv",
+        "-e",
+        'display notification (item 1 of argv) with title "Todozer"',
+        "-e",
+        "end run",
+        message,
+    ]
+    assert notifier.get_desktop_command(message, "windows") is None
+
+
+def test_incomplete_notifier():
+    class IncompleteNotifier(notifier.Notifier):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteNotifier()
@@ -0,0 +1,61 @@
+import datetime
+
+import tests.helpers
+from todozer.scheduler import get_rule, occurrences
+
+PATTERNS = [
+    "2024-02-29",
+    "every day",
+    "every day from 2024-03-10",
+    "every 1 day from 2023-12-29",
+    "every 3 days from 2024-01-05",
+    "every 10 days from 2025-06-01",
+    "every month, day 5",
+    "every month, day 31",
+    "every month, last day",
+    "every month, 15 day from 2024-04-20",
+    "weekdays",
+    "every weekday from 2024-05-01",
+    "every year, Feb 29",
+    "every year, December 31",
+    "every year, 4 July from 2025-01-01",
+    "every Monday",
+    "every Sunday from 2024-02-11",
+    "every 2 Wednesday from 2024-01-03",
+    "every 3 Friday from 2024-01-04",
+    "something odd",
+    "",
+]
+
+
+def get_matched_dates(plan, start: datetime.date, end: datetime.date) -> list:
+    rule = get_rule(plan)
+    dates = []
+
+    date = start
+
+    while date <= end:
+        if rule.match_date(date):
+            dates.append(date)
+
+        date += datetime.timedelta(days=1)
+
+    return dates
+
+
+def test_occurrences():
+    windows = [
+        (datetime.date(2024, 1, 1), datetime.date(2026, 12, 31)),
+        (datetime.date(2024, 2, 28), datetime.date(2024, 3, 1)),
+        (datetime.date(2024, 3, 15), datetime.date(2024, 3, 15)),
+        (datetime.date(2024, 3, 15), datetime.date(2024, 3, 14)),
+    ]
+
+    for pattern in PATTERNS:
+        plan = tests.helpers.get_plan_en(pattern)
+
+        for start, end in windows:
+            expected = get_matched_dates(plan, start, end)
+            actual = list(occurrences(plan, start, end))
+
+            assert actual == expected, f"{pattern}: {start} - {end}"
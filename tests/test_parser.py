@@ -0,0 +1,81 @@
+import datetime
+
+from todozer import parser
+from todozer.todo.list_todo import ListTodo
+from todozer.todo.task_todo import TaskTodo
+
+
+def get_kind(line: str) -> str:
+    if ListTodo.match(line):
+        kind = parser.LIST_LINE
+    elif TaskTodo.match(line):
+        kind = parser.TASK_LINE
+    elif line.strip() == "":
+        kind = parser.EMPTY_LINE
+    else:
+        kind = parser.TEXT_LINE
+
+    return kind
+
+
+def test_tokenize():
+    lines = [
+        "# 2023-07-24",
+        "# Routine",
+        "#2023-07-24",
+        " # 2023-07-24",
+        "- [ ] 10:00 Take a pill; every day",
+        "- [x] Done",
+        "- [X] Done",
+        "-[ ]title",
+        "-   [\t] title",
+        "- [] title",
+        "- [xx] title",
+        "- title",
+        "    notify at 10:00",
+        "10:00 - 11:30",
+        "",
+        "   ",
+        "\t",
+    ]
+
+    expected = [(get_kind(line), line) for line in lines]
+
+    assert list(parser.tokenize(lines)) == expected
+
+
+def test_sections(tmp_path):
+    days = [
+        f"# 2023-07-{day:02}\n\n- [ ] Task {day}\n    notes" for day in range(1, 11)
+    ]
+    days.insert(6, "# Routine\n- [ ] No date")
+
+    for reverse in (False, True):
+        for newline in ("\n", "\r\n"):
+            file_path = tmp_path / "tasks.md"
+            text = "\n\n".join(reversed(days) if reverse else days)
+            file_path.write_bytes(text.replace("\n", newline).encode())
+
+            all_items = parser.Parser(file_path, TaskTodo).parse()
+
+            sections = parser.Parser(file_path, TaskTodo).sections()
+
+            assert list(map(str, sections)) == list(map(str, all_items))
+
+            start = datetime.date(2023, 7, 3)
+            end = datetime.date(2023, 7, 5)
+
+            expected = [
+                item
+                for item in all_items
+                if item.date is not None and start <= item.date <= end
+            ]
+
+            sections = parser.Parser(file_path, TaskTodo).sections(start, end)
+
+            assert list(map(str, sections)) == list(map(str, expected))
+
+            index = parser.get_sections_index(file_path.read_bytes())
+            sections = parser.Parser(file_path, TaskTodo).sections(start, end, index)
+
+            assert list(map(str, sections)) == list(map(str, expected))
@@ -0,0 +1,36 @@
+import datetime
+
+import tests.helpers
+import tests.test_occurrences
+from todozer.plan_calendar import PlanCalendar
+from todozer.scheduler import match
+from todozer.todo.list_todo import ListTodo
+
+
+def test_plan_calendar():
+    section = ListTodo("# Nested")
+    plans = []
+
+    for index, pattern in enumerate(tests.test_occurrences.PATTERNS):
+        plan = tests.helpers.get_plan_en(pattern)
+        plans.append(plan)
+
+        if index % 2:
+            section.items.append(plan)
+
+    plans_file_items = [plan for index, plan in enumerate(plans) if not index % 2]
+    plans_file_items.append(section)
+
+    calendar = PlanCalendar(plans_file_items)
+
+    expected_order = [item for item in plans_file_items if item is not section]
+    expected_order += section.items
+
+    date = datetime.date(2024, 1, 1)
+
+    while date <= datetime.date(2025, 12, 31):
+        expected = [plan for plan in expected_order if match(plan, date)[1]]
+
+        assert calendar.get_plans(date) == expected, date
+
+        date += datetime.timedelta(days=1)
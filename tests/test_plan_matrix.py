@@ -0,0 +1,70 @@
+import datetime
+
+import pytest
+
+import tests.helpers
+import tests.test_occurrences
+from todozer import plan_matrix
+from todozer.plan_calendar import PlanCalendar
+from todozer.scheduler import get_rule
+
+START = datetime.date(2023, 12, 1)
+END = datetime.date(2025, 12, 31)
+
+
+def get_expected_matches(rules: list) -> list[list[int]]:
+    matches = []
+    date = START
+
+    while date <= END:
+        matches.append([i for i, rule in enumerate(rules) if rule.match_date(date)])
+        date += datetime.timedelta(days=1)
+
+    return matches
+
+
+def get_rules() -> list:
+    return [
+        get_rule(tests.helpers.get_plan_en(pattern))
+        for pattern in tests.test_occurrences.PATTERNS
+    ]
+
+
+def test_matches_python():
+    rules = get_rules()
+
+    matches = plan_matrix.get_matches(rules, START, END, engine="python")
+
+    assert matches == get_expected_matches(rules)
+
+
+def test_matches_numpy():
+    pytest.importorskip("numpy")
+
+    rules = get_rules()
+
+    assert plan_matrix.get_engine() == "numpy"
+
+    matrix = plan_matrix.get_matrix(rules, START, END, engine="numpy")
+    assert matrix.shape == (len(rules), (END - START).days + 1)
+
+    matches = plan_matrix.get_matches(rules, START, END, engine="numpy")
+    assert matches == get_expected_matches(rules)
+
+
+def test_plan_calendar_prepare():
+    plans = [
+        tests.helpers.get_plan_en(pattern)
+        for pattern in tests.test_occurrences.PATTERNS
+    ]
+
+    calendar = PlanCalendar(plans)
+    prepared_calendar = PlanCalendar(plans)
+    prepared_calendar.prepare(START, END)
+
+    date = START - datetime.timedelta(days=7)
+
+    while date <= END + datetime.timedelta(days=7):
+        assert prepared_calendar.get_plans(date) == calendar.get_plans(date), date
+
+        date += datetime.timedelta(days=1)
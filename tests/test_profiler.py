@@ -0,0 +1,36 @@
+import time
+
+from todozer import profiler
+
+
+@profiler.timed("inner")
+def inner() -> None:
+    time.sleep(0.02)
+
+
+@profiler.timed("outer")
+def outer() -> None:
+    time.sleep(0.01)
+    inner()
+    inner()
+
+
+def test_timed():
+    assert profiler.get_timings() == {}
+
+    profiler.start()
+    outer()
+
+    timings = profiler.get_timings()
+    profiler.stop()
+
+    assert list(timings) == ["outer", "inner"]
+    assert timings["outer"][1] == 1 and timings["inner"][1] == 2
+
+    # Time of inner phases isn't counted in the outer one.
+    assert 0.01 <= timings["outer"][0] < 0.03
+    assert timings["inner"][0] >= 0.04
+
+    outer()
+
+    assert profiler.get_timings() == {}
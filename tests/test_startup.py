@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+# Modules which quick commands (like show) must not import, since they are slow to load.
+HEAVY_MODULES = {
+    "asyncio",
+    "requests",
+    "todozer.commands.command_beep",
+    "todozer.notifier",
+}
+
+
+def get_imported_modules(code: str) -> set[str]:
+    """
+    Returns names of modules imported by a piece of code, according to -X importtime.
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = set()
+
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+
+    return modules
+
+
+def test_startup():
+    modules = get_imported_modules(
+        "import todozer.app; import todozer.commands.command_show"
+    )
+
+    assert "todozer.app" in modules
+    assert not modules & HEAVY_MODULES
@@ -0,0 +1,82 @@
+import datetime
+
+import yaml
+
+from todozer import state_file
+
+
+def test_journal(tmp_path):
+    # A state file written by the previous versions of the app.
+    (tmp_path / "todozer.dat").write_text(
+        "last_planning_date: 2023-07-24\n"
+        "triggered_notifications:\n"
+        "  '2023-07-24':\n"
+        "    '- [ ] Task':\n"
+        "    - '10:00'\n"
+    )
+
+    data = state_file.load(tmp_path)
+
+    assert data["last_planning_date"] == datetime.date(2023, 7, 24)
+    assert not state_file.add_triggered_notification(
+        data, "2023-07-24", "- [ ] Task", "10:00"
+    )
+
+    notifications = [
+        ("2023-07-24", "- [ ] Task", "11:00"),
+        ("2023-07-25", "- [ ] Another task", "10:00"),
+    ]
+
+    for notification in notifications:
+        assert state_file.add_triggered_notification(data, *notification)
+
+    state_file.save_triggered_notifications(tmp_path, notifications)
+
+    # A line which is not written completely is skipped.
+    with open(tmp_path / "todozer.journal", "a") as journal_file:
+        journal_file.write('["2023-07-25", "- [ ] Ta')
+
+    assert state_file.load(tmp_path) == data
+
+    # A notification recorded after such a line is not lost.
+    notification = ("2023-07-26", "- [ ] Task", "12:00")
+
+    assert state_file.add_triggered_notification(data, *notification)
+
+    state_file.save_triggered_notifications(tmp_path, [notification])
+
+    assert state_file.load(tmp_path) == data
+
+    state_file.save(tmp_path, data)
+
+    assert not (tmp_path / "todozer.journal").exists()
+    assert state_file.load(tmp_path) == data
+
+
+def test_journal_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_file, "JOURNAL_MAX_SIZE", 100)
+
+    data = state_file.get_data_by_default()
+
+    for hour in range(10):
+        notification = ("2023-07-24", "- [ ] Task", f"{hour:02}:00")
+
+        state_file.add_triggered_notification(data, *notification)
+        state_file.save_triggered_notifications(tmp_path, [notification])
+
+        journal_path = tmp_path / "todozer.journal"
+
+        assert not journal_path.exists() or journal_path.stat().st_size <= 100
+
+    assert (tmp_path / "todozer.dat").exists()
+    assert state_file.load(tmp_path) == data
+
+
+def test_yaml_implementations():
+    data = state_file.get_data_by_default()
+    state_file.add_triggered_notification(data, "2023-07-24", "- [ ] Задача", "10:00")
+
+    text = yaml.dump(data, Dumper=state_file.SafeDumper)
+
+    assert text == yaml.safe_dump(data)
+    assert yaml.load(text, Loader=state_file.SafeLoader) == yaml.safe_load(text)
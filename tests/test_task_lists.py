@@ -0,0 +1,74 @@
+import datetime
+
+from todozer import parser, plan_calendar, task_lists, utils
+from todozer.todo.list_todo import ListTodo
+from todozer.todo.plan_todo import PlanTodo
+from todozer.todo.task_todo import TaskTodo
+
+
+def test_save_tasks_file_items(tmp_path):
+    file_path = tmp_path / "tasks.md"
+    content = (
+        "# 2023-07-01\n\n- [x] Task 1\n\n\n    notes\n\n\n"
+        "# 2023-07-03\n- [x] Task 3\n\n"
+        "# 2023-07-02\n\n- [x] Task 2"
+    )
+    file_path.write_text(content)
+
+    config = utils.get_config(tmp_path)
+
+    tasks = task_lists.load_tasks_file_items(config, tmp_path)
+
+    tasks.get_list(datetime.date(2023, 7, 2)).items.append(TaskTodo("- [ ] New"))
+    tasks.append(ListTodo("# 2023-07-04"))
+
+    task_lists.save_tasks_file_items(tasks, config, tmp_path)
+
+    # Unchanged lists are copied as they are, changed and new ones are converted to text.
+    assert file_path.read_text() == (
+        "# 2023-07-01\n\n- [x] Task 1\n\n\n    notes\n\n"
+        "# 2023-07-02\n\n- [x] Task 2\n- [ ] New\n\n"
+        "# 2023-07-03\n- [x] Task 3\n\n"
+        "# 2023-07-04\n\n"
+    )
+    assert (tmp_path / "tasks.md.bak").read_text() == content
+
+    items = parser.Parser(file_path, TaskTodo).parse()
+
+    assert list(map(str, items)) == list(map(str, tasks))
+
+
+def test_get_planned_tasks():
+    plans = [
+        PlanTodo("- [ ] 10:00 Daily; every day"),
+        PlanTodo("- [ ] Once; 2023-07-02"),
+    ]
+    plans[0].lines.append("    notify at 10:00")
+
+    calendar = plan_calendar.PlanCalendar(plans)
+    date = datetime.date(2023, 7, 2)
+
+    tasks = task_lists.get_planned_tasks(calendar, date)
+
+    assert [task.lines for task in tasks] == [
+        ["- [ ] 10:00 Daily", "    notify at 10:00"],
+        ["- [ ] Once"],
+    ]
+
+    # Tasks planned again are copies, so changing them doesn't change the cached ones.
+    tasks[0].lines[0] = "- [x] 10:00 Daily"
+
+    tasks_again = task_lists.get_planned_tasks(calendar, date)
+
+    assert tasks_again[0] is not tasks[0]
+    assert tasks_again[0].title_line == "- [ ] 10:00 Daily"
+    assert tasks_again[0].is_scheduled and tasks[0].is_completed
+
+    # Calendars of changed plans don't share the cache.
+    plans[1].lines[0] = "- [ ] Once; 2023-07-03"
+
+    tasks_changed = task_lists.get_planned_tasks(
+        plan_calendar.PlanCalendar(plans), date
+    )
+
+    assert [task.title for task in tasks_changed] == ["10:00 Daily"]
@@ -0,0 +1,43 @@
+import datetime
+
+from todozer.todo.plan_todo import PlanTodo
+from todozer.todo.task_todo import TaskTodo
+
+
+def test_parsed_values_follow_lines():
+    task = TaskTodo("- [ ] 10:00 Call mom")
+
+    assert task.title == "10:00 Call mom"
+    assert task.time == datetime.time(10, 0)
+    assert task.notifications == []
+
+    task.lines[0] = "- [x] 11:30 Call dad"
+    task.lines.append("    notify at 11:20")
+
+    assert task.title == "11:30 Call dad"
+    assert task.time == datetime.time(11, 30)
+    assert task.is_completed
+    assert task.notifications == [{"time": datetime.time(11, 20)}]
+
+    del task.lines[1:]
+
+    assert task.notifications == []
+
+    task.lines = ["- [ ] Buy milk"]
+
+    assert task.title == "Buy milk"
+    assert not task.has_time
+
+
+def test_copy():
+    plan = PlanTodo("- [ ] 10:00 Daily; every day")
+
+    assert plan.title == "10:00 Daily"
+
+    copy = plan.copy()
+    copy.lines[0] = "- [ ] 12:00 Weekly; every Monday"
+
+    # Changing the copy's lines changes neither the plan's lines nor its values.
+    assert plan.lines == ["- [ ] 10:00 Daily; every day"]
+    assert (plan.title, plan.pattern) == ("10:00 Daily", "every day")
+    assert (copy.title, copy.pattern) == ("12:00 Weekly", "every Monday")
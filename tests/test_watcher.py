@@ -0,0 +1,65 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from todozer import watcher
+
+
+def test_polling(tmp_path, monkeypatch):
+    file_path = tmp_path / "tasks.md"
+    file_path.write_text("- [ ] Task\n")
+
+    monkeypatch.setattr(watcher, "POLL_INTERVAL", 0.01)
+
+    with watcher.FileWatcher([file_path], use_inotify=False) as file_watcher:
+        # Neither reading a file nor touching other files is a change.
+        file_path.read_text()
+        (tmp_path / "other.md").write_text("Other\n")
+
+        assert not file_watcher.wait(0.1)
+
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert file_watcher.wait(0.1)
+        assert not file_watcher.wait(0.1)
+
+        # The size is changed, but the modification time is the same.
+        stat = file_path.stat()
+        file_path.write_text("- [ ] Task\n- [ ] One more task\n")
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert file_watcher.wait(0.1)
+        assert not file_watcher.wait(0.1)
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux only"
+)
+def test_inotify(tmp_path, monkeypatch):
+    file_path = tmp_path / "tasks.md"
+    file_path.write_text("- [ ] Task\n")
+
+    # In case files were polled instead, they would be checked only after the timeout.
+    monkeypatch.setattr(watcher, "POLL_INTERVAL", 60.0)
+
+    def replace():
+        time.sleep(0.2)
+
+        (tmp_path / "tasks.md.tmp").write_text("- [x] Task\n")
+        os.replace(tmp_path / "tasks.md.tmp", file_path)
+
+    with watcher.FileWatcher([file_path]) as file_watcher:
+        thread = threading.Thread(target=replace)
+        thread.start()
+
+        started_at = time.monotonic()
+        is_changed = file_watcher.wait(10)
+
+        thread.join()
+
+    assert is_changed
+    assert time.monotonic() - started_at < 5
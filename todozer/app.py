@@ -5,8 +5,10 @@ from sys import stdout
 
 import click
 
-from todozer import constants
-from todozer.commands import command_beep, command_make, command_show, command_test
+from todozer import constants, profiler
+
+# Command modules are imported by their commands only, since some of them import
+# heavy dependencies (like requests), which would slow down every command's start.
 
 
 def __get_path(path: str | None) -> str:
@@ -31,27 +33,52 @@ def __path_type() -> click.Path:
 
 
 @click.group(help="CLI tool to manage tasks & duties.")
-def cli():
+@click.option(
+    "--profile", is_flag=True, help="Print how long each phase of a command takes."
+)
+@click.option(
+    "--profile-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Run a command under cProfile and save its statistics to a file.",
+)
+@click.pass_context
+def cli(context: click.Context, profile: bool, profile_file: str | None):
     stdout.reconfigure(encoding=constants.ENCODING)
 
+    if profile or profile_file is not None:
+        profiler.start(with_cprofile=profile_file is not None)
+        context.call_on_close(lambda: profiler.stop(profile_file))
+
 
 @cli.command(help="Make planned tasks for a brand-new day.")
 @click.option("-p", "--path", type=__path_type(), help=__path_help())
 def make(path: str | None) -> None:
+    from todozer.commands import command_make
+
     path = __get_path(path)
     command_make.main(path)
 
 
 @cli.command(help="Check that data files have no mistakes.")
 @click.option("-p", "--path", type=__path_type(), help=__path_help())
-def test(path: str | None) -> None:
+@click.option(
+    "--horizon",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Also check how plans are scheduled for a number of days.",
+)
+def test(path: str | None, horizon: int) -> None:
+    from todozer.commands import command_test
+
     path = __get_path(path)
-    command_test.main(path)
+    command_test.main(path, horizon)
 
 
 @cli.command(help="Set alarm according to notification settings.")
 @click.option("-p", "--path", type=__path_type(), help=__path_help())
 def beep(path: str | None):
+    from todozer.commands import command_beep
+
     path = __get_path(path)
     command_beep.main(path)
 
@@ -66,9 +93,19 @@ def beep(path: str | None):
     "-t", "--timesheet", is_flag=True, help="Show only tasks with time logged."
 )
 @click.option("-l", "--logs", is_flag=True, help="Show time logged for each task.")
-def show(path: str | None, timesheet: bool, logs: bool, period: str, value: str):
+@click.option("--pager", is_flag=True, help="Page through the output.")
+def show(
+    path: str | None,
+    timesheet: bool,
+    logs: bool,
+    pager: bool,
+    period: str,
+    value: str,
+):
+    from todozer.commands import command_show
+
     path = __get_path(path)
-    command_show.main(period, value, path, timesheet, logs)
+    command_show.main(period, value, path, timesheet, logs, pager)
 
 
 if __name__ == "__main__":
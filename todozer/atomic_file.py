@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""Methods to write files safely: a file is either written completely, or not changed at all."""
+
+import contextlib
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+
+
+@contextlib.contextmanager
+def open_for_writing(
+    file_name: str,
+    binary: bool = False,
+    encoding: str | None = None,
+    backup_file_name: str | None = None,
+    sync: bool = True,
+) -> Iterator:
+    """
+    Opens a temporary file next to a given one for writing. When it is written,
+    it replaces the given file at once (the file a symbolic link points to,
+    in case it is a link), keeping the file's permissions. In case of an exception,
+    the temporary file is removed, and the given file is left as it is.
+
+    Unless sync is False, the temporary file is flushed to disk before replacing,
+    so a crash of the system doesn't leave an empty file instead of the given one.
+
+    In case a backup file name is given, the previous file becomes the backup
+    by means of a hard link (if the file system supports them) instead of copying it.
+    """
+
+    file_name = os.path.realpath(file_name)
+    directory, base_name = os.path.split(file_name)
+
+    temp_file = tempfile.NamedTemporaryFile(
+        "wb" if binary else "w",
+        encoding=encoding,
+        dir=directory,
+        prefix=f".{base_name}.",
+        delete=False,
+    )
+
+    try:
+        with temp_file:
+            yield temp_file
+
+            if sync:
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+
+        if os.path.exists(file_name):
+            shutil.copymode(file_name, temp_file.name)
+
+            if backup_file_name is not None:
+                make_backup(file_name, backup_file_name)
+
+        os.replace(temp_file.name, file_name)
+
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_file.name)
+
+        raise
+
+    if sync:
+        sync_directory(directory)
+
+
+def make_backup(file_name: str, backup_file_name: str) -> None:
+    """
+    Makes a backup of a file as a hard link, or as a copy if it is not possible.
+    """
+
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(backup_file_name)
+
+    try:
+        os.link(file_name, backup_file_name)
+    except OSError:
+        shutil.copyfile(file_name, backup_file_name)
+
+
+def sync_directory(directory: str) -> None:
+    """
+    Flushes a directory's entries to disk, so a file renamed in it stays renamed
+    after a crash of the system. It is not possible (and not needed) on Windows.
+    """
+
+    if os.name != "posix":
+        return
+
+    descriptor = os.open(directory, os.O_RDONLY)
+
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+"""
+Methods to read and write the app's cache of data built from files' content.
+
+The cache is stored as JSON, since the data directory is often synced with other
+devices, and loading anything else (like pickle) from it could run arbitrary code.
+So values cached must be made of JSON types: tuples are loaded as lists.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Callable
+
+from todozer import atomic_file, constants
+
+CACHE_FORMAT = 3
+
+# The coarsest modification time resolution of file systems (FAT), in nanoseconds.
+MTIME_RESOLUTION = 2_000_000_000
+
+
+def get_cache_file_path(path: str | None) -> str:
+    """Returns the app's cache file name, which is stored next to the data file."""
+
+    filename = "todozer.cache"
+
+    if path is not None:
+        filename = os.path.join(path, filename)
+
+    return filename
+
+
+def get_digest(data: bytes) -> str:
+    """Returns a hash of a file's content."""
+
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def load(path: str | None) -> dict:
+    """
+    Returns cached entries by file names. The cache is ignored if it is missing,
+    corrupt or written by another version of the app.
+    """
+
+    try:
+        with open(get_cache_file_path(path), encoding=constants.ENCODING) as cache_file:
+            cache = json.load(cache_file)
+
+    except (OSError, ValueError):
+        return {}
+
+    if (
+        isinstance(cache, dict)
+        and cache.get("format") == CACHE_FORMAT
+        and isinstance(cache.get("files"), dict)
+    ):
+        return cache["files"]
+
+    return {}
+
+
+def save(path: str | None, files: dict) -> None:
+    """
+    Writes cached entries. The cache is replaced at once, so a reader never gets
+    a partially written file. Failing to write the cache is not an error.
+    """
+
+    try:
+        with atomic_file.open_for_writing(
+            get_cache_file_path(path), encoding=constants.ENCODING, sync=False
+        ) as cache_file:
+            json.dump({"format": CACHE_FORMAT, "files": files}, cache_file)
+
+    except OSError:
+        pass
+
+
+def get(path: str | None, file_name: str, build: Callable[[bytes], object]):
+    """
+    Returns a value built from a file's content by the build function, cached by
+    the file's path, modification time, size and content hash.
+
+    In case the modification time and the size of the file are not changed,
+    the file isn't read at all. In case only the time is changed, the file is read
+    and the value is rebuilt only if its content hash differs.
+
+    The file could be rewritten with the same size within a single tick of its
+    modification time, though. That's why the file is not read only in case it had
+    been modified long enough (more than the coarsest time resolution) before it was
+    read last time: any later change gets a later time. Otherwise, the file is read
+    and its content hash is compared.
+    """
+
+    key = os.path.abspath(file_name)
+    stat = os.stat(file_name)
+
+    files = load(path)
+    entry = files.get(key)
+
+    if not isinstance(entry, list) or len(entry) != 5:
+        entry = None
+
+    is_unchanged = entry is not None and entry[:2] == [stat.st_mtime_ns, stat.st_size]
+
+    if is_unchanged and stat.st_mtime_ns + MTIME_RESOLUTION < entry[4]:
+        return entry[3]
+
+    read_at = time.time_ns()
+
+    with open(file_name, "rb") as file:
+        data = file.read()
+
+    digest = get_digest(data)
+
+    if entry is not None and entry[2] == digest:
+        value = entry[3]
+    else:
+        value = build(data)
+
+    # The time is taken before reading, so a file changed while being read
+    # doesn't look unchanged next time.
+    files[key] = [stat.st_mtime_ns, stat.st_size, digest, value, read_at]
+    save(path, files)
+
+    return value
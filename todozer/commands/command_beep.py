@@ -2,21 +2,39 @@
 
 """Sends notifications that a user has set."""
 
+import asyncio
 import datetime
+import heapq
 import logging
+import os
 import platform
 import subprocess
-import time
 
-import requests
-
-from todozer import echo, state_file, task_lists, utils
+from todozer import (
+    echo,
+    lock_file,
+    notifier,
+    plan_calendar,
+    profiler,
+    state_file,
+    task_lists,
+    utils,
+    watcher,
+)
 from todozer.todo import list_todo
 
+# The longest time to sleep for without checking the clock, since the system clock
+# may be changed, or the system may be suspended, while the app is sleeping.
+MAX_WAITING_TIME = datetime.timedelta(hours=1)
+
 
 def main(path: str) -> None:
     """
     Main entry point of this command.
+
+    The data files are parsed only when they are changed: between changes,
+    notifications to send are kept in memory in a heap ordered by their time,
+    and the app just sleeps until the next one is due or a file is changed.
     """
 
     config = utils.get_config(path)
@@ -24,71 +42,185 @@ def main(path: str) -> None:
 
     logging.debug("Notifier is starting...")
 
-    while True:
-        state = state_file.load(path=path)
+    asyncio.run(__run(config, path))
 
-        notifications_today = []
 
-        tasks_file_items = task_lists.load_tasks_file_items(config, path)
-        plans_file_items = task_lists.load_plans_file_items(config, path)
+async def __run(config, path: str) -> None:
+    """
+    Runs the notifier's loop. Notifications are delivered by a notifier of the backend
+    chosen in the settings in background, so the loop never waits for them to be sent.
+    """
 
-        date = state["last_planning_date"]
+    backend_notifier = notifier.get_notifier(config, path)
 
-        future_days_number = config.getint("NOTIFICATIONS", "future_days_number")
+    with watcher.FileWatcher(__get_file_names(config, path)) as file_watcher:
+        async with backend_notifier:
+            is_changed = True
 
-        for _ in range(future_days_number):
-            tasks_group = __get_tasks_group(
-                tasks_file_items, plans_file_items, date, state
-            )
+            while True:
+                if is_changed:
+                    logging.debug("Loading data files...")
 
-            __process_date(notifications_today, date, tasks_group, config, state)
+                    with lock_file.lock(path, shared=True):
+                        state = state_file.load(path=path)
+                        schedule = __get_schedule(config, path, state)
 
-            date += datetime.timedelta(days=1)
+                notifications = send_due_notifications(
+                    schedule, backend_notifier, state
+                )
 
-        state_file.save(path, state)
+                if notifications:
+                    state_file.save_triggered_notifications(path, notifications)
+                    file_watcher.refresh()
 
-        __print_upcoming_notifications_for_today(notifications_today)
+                __print_upcoming_notifications_for_today(
+                    __get_notifications_today(schedule)
+                )
 
-        __wait_for_next_minute()
+                seconds_to_wait = get_seconds_to_wait(schedule)
+                is_changed = await file_watcher.wait_async(seconds_to_wait)
 
 
-def __process_date_task_notifications(
-    task, notifications_today, date, tasks_group, config, state
-):
-    for notification in task.notifications:
-        remind_at = datetime.datetime(
-            year=tasks_group.date.year,
-            month=tasks_group.date.month,
-            day=tasks_group.date.day,
-            hour=notification["time"].hour,
-            minute=notification["time"].minute,
-            second=0,
-        )
+def __get_file_names(config, path: str) -> list[str]:
+    """
+    Returns names of the files which notifications depend on.
+    """
+
+    tasks_file_name = config.get("TASKS", "file_name")
+    plans_file_name = config.get("PLANS", "file_name")
+
+    if path is not None:
+        tasks_file_name = os.path.join(path, tasks_file_name)
+        plans_file_name = os.path.join(path, plans_file_name)
+
+    return [state_file.get_data_file_path(path), tasks_file_name, plans_file_name]
+
+
+@profiler.timed("scheduling")
+def __get_schedule(config, path: str, state: dict) -> list[tuple]:
+    """
+    Returns notifications of scheduled tasks for the days to notify about,
+    the tasks which are planned, but not made yet, included.
+
+    The notifications are (time to remind at, number, notification) tuples
+    arranged as a heap, so the earliest one is always the first.
+    """
+
+    schedule = []
+
+    date = state["last_planning_date"]
+
+    future_days_number = config.getint("NOTIFICATIONS", "future_days_number")
+    last_date = date + datetime.timedelta(days=future_days_number - 1)
+
+    tasks_file_items = task_lists.load_tasks_file_lists(config, path, date, last_date)
+    plans_file_items = task_lists.load_plans_file_items(config, path)
+    plans = plan_calendar.PlanCalendar(plans_file_items)
+    plans.prepare(date, last_date)
+
+    for _ in range(future_days_number):
+        tasks_group = __get_tasks_group(tasks_file_items, plans, date, state)
+
+        for task in tasks_group.items:
+            if task.is_scheduled and task.notifications:
+                for notification in task.notifications:
+                    remind_at = datetime.datetime.combine(date, notification["time"])
+
+                    notification = {
+                        "date": date,
+                        "time": notification["time"],
+                        "task": task,
+                    }
+
+                    schedule.append((remind_at, len(schedule), notification))
+
+        date += datetime.timedelta(days=1)
+
+    heapq.heapify(schedule)
+
+    return schedule
+
+
+def send_due_notifications(
+    schedule: list[tuple],
+    backend_notifier: notifier.Notifier,
+    state: dict,
+    now: datetime.datetime | None = None,
+) -> list[tuple[str, str, str]]:
+    """
+    Sends all the notifications which are due, removing them from the schedule.
+    Notifications due at the same time are sent together, as a single message
+    (unless it is too long). Returns the notifications triggered, as (date,
+    task's title line, time) tuples.
+    """
+
+    notifications = []
+    titles = []
 
-        if datetime.datetime.now() >= remind_at:
-            __notify(date, task, notification["time"], config, state)
-        elif date == datetime.date.today():
-            notifications_today.append(
-                {"time": notification["time"], "title": task.title}
-            )
+    if now is None:
+        now = datetime.datetime.now()
 
+    while schedule and schedule[0][0] <= now:
+        _, _, notification = heapq.heappop(schedule)
 
-def __process_date(notifications_today, date, tasks_group, config, state):
-    for task in tasks_group.items:
-        if task.is_scheduled and task.notifications:
-            __process_date_task_notifications(
-                task, notifications_today, date, tasks_group, config, state
-            )
+        date_string = utils.get_string_from_date(notification["date"])
+        title_line = notification["task"].title_line
+        time_string = notification["time"].strftime("%H:%M")
 
+        if state_file.add_triggered_notification(
+            state, date_string, title_line, time_string
+        ):
+            notifications.append((date_string, title_line, time_string))
+            titles.append(notification["task"].title)
 
-def __get_tasks_group(tasks_file_items, plans_file_items, date, state):
+    if titles:
+        backend_notifier.send_all(titles)
+
+    return notifications
+
+
+def __get_notifications_today(schedule: list[tuple]) -> list[dict]:
+    today = datetime.date.today()
+
+    return [
+        {"time": notification["time"], "title": notification["task"].title}
+        for _, _, notification in schedule
+        if notification["date"] == today
+    ]
+
+
+def get_seconds_to_wait(
+    schedule: list[tuple], now: datetime.datetime | None = None
+) -> float:
+    """
+    Returns the number of seconds until the next notification is due,
+    but no longer than until tomorrow, when today's notifications are to be shown,
+    and no longer than MAX_WAITING_TIME.
+    """
+
+    if now is None:
+        now = datetime.datetime.now()
+
+    tomorrow = datetime.datetime.combine(
+        utils.get_date_of_tomorrow(now.date()), datetime.time()
+    )
+
+    wake_at = min(tomorrow, now + MAX_WAITING_TIME)
+
+    if schedule:
+        wake_at = min(wake_at, schedule[0][0])
+
+    return max((wake_at - now).total_seconds(), 0)
+
+
+def __get_tasks_group(tasks_file_items, plans, date, state):
     tasks_group = task_lists.get_tasks_list_by_date(tasks_file_items, date)
 
     if tasks_group is None:
         tasks_group = list_todo.ListTodo(f"# {utils.get_string_from_date(date)}")
 
     if date > state["last_planning_date"]:
-        task_lists.fill_tasks_list(tasks_group, plans_file_items)
+        task_lists.fill_tasks_list(tasks_group, plans)
 
     return tasks_group
 
@@ -129,51 +261,6 @@ def __print_upcoming_notifications_for_today(notifications_today) -> None:
     echo.comment("Don't stop this app to get beeps on time!")
 
 
-def __notify(date, task, notification_time, config, state) -> None:
-    date_string = utils.get_string_from_date(date)
-    time_string = notification_time.strftime("%H:%M")
-
-    triggered_notifications = state.get("triggered_notifications")
-
-    if triggered_notifications.get(date_string) is None:
-        triggered_notifications[date_string] = {}
-
-    if triggered_notifications[date_string].get(task.title_line) is None:
-        triggered_notifications[date_string][task.title_line] = []
-
-    if time_string not in triggered_notifications[date_string][task.title_line]:
-        __send_to_telegram_chat(task.title, config)
-        triggered_notifications[date_string][task.title_line].append(time_string)
-
-
-def __wait_for_next_minute() -> None:
-    logging.debug(f"Waiting for the next minute")
-
-    time.sleep(60 - datetime.datetime.now().second)
-
-
-def __send_to_telegram_chat(text: str, config: dict) -> None:
-    bot_api_token = config.get("NOTIFICATIONS", "telegram_bot_api_token")
-    chat_id = config.get("NOTIFICATIONS", "telegram_chat_id")
-
-    try:
-        url = f"https://api.telegram.org/bot{bot_api_token}/sendMessage"
-
-        data = {
-            "parse_mode": "HTML",
-            "chat_id": chat_id,
-            "text": f"{text}",
-        }
-
-        response = requests.post(url, params=data)
-
-        if response.status_code != 200:
-            raise Exception(response.text)
-
-    except Exception as error:
-        logging.error(f"Error while sending a message to Telegram: {error}")
-
-
 def __tasks_for_today(
     items: list, last_planned_date: datetime.date
 ) -> list_todo.ListTodo | None:
@@ -4,7 +4,7 @@
 
 import logging
 
-from todozer import echo, state_file, task_lists, utils
+from todozer import echo, lock_file, plan_calendar, state_file, task_lists, utils
 
 
 def main(path: str) -> None:
@@ -20,17 +20,21 @@ def main(path: str) -> None:
 
     logging.debug("Creating planned tasks...")
 
+    with lock_file.lock(path):
+        __make(config, path)
+
+
+def __make(config, path: str) -> None:
     state = state_file.load(path)
 
     tasks_file_items = task_lists.load_tasks_file_items(config, path)
     plans_file_items = task_lists.load_plans_file_items(config, path)
+    plans = plan_calendar.PlanCalendar(plans_file_items)
 
     task_lists.add_tasks_lists(tasks_file_items, state["last_planning_date"])
 
     if check_for_tasks_in_progress(tasks_file_items):
-        filled_list_titles = task_lists.fill_tasks_lists(
-            tasks_file_items, plans_file_items, state
-        )
+        filled_list_titles = task_lists.fill_tasks_lists(tasks_file_items, plans, state)
 
         if filled_list_titles:
             task_lists.save_tasks_file_items(tasks_file_items, config, path)
@@ -4,79 +4,86 @@
 
 import datetime
 
-from todozer import echo, state_file, task_lists, utils
+from todozer import (
+    echo,
+    lock_file,
+    plan_calendar,
+    profiler,
+    state_file,
+    task_lists,
+    utils,
+)
 from todozer.todo import list_todo
 
 
-def main(period: str, value: str, path: str, timesheet: bool, logs: bool) -> None:
+def main(
+    period: str,
+    value: str,
+    path: str,
+    timesheet: bool,
+    logs: bool,
+    pager: bool = False,
+) -> None:
     """
-    Checks plans file for errors.
+    Outputs tasks for a period, the planned ones included. The output is written
+    at once (via a pager, in case it is required) when all the days are rendered.
     """
 
     config = utils.get_config(path)
     utils.set_logging(config)
 
-    state = state_file.load(path)
+    dates = __get_dates(period, value)
 
-    tasks = task_lists.load_tasks_file_items(config, path)
-    plans = task_lists.load_plans_file_items(config, path)
+    if not dates:
+        return
 
-    if period == "today":
-        __show_today(tasks, plans, state, timesheet, logs)
-    elif period == "last":
-        __show_last_n_days(
-            tasks, plans, state, int(value) if value else 1, timesheet, logs
-        )
-    elif period == "next":
-        __show_next_n_days(
-            tasks, plans, state, int(value) if value else 1, timesheet, logs
-        )
-    elif period == "date":
-        __show_date(tasks, plans, state, value, timesheet, logs)
+    with lock_file.lock(path, shared=True):
+        state = state_file.load(path)
+        tasks = task_lists.load_tasks_file_lists(config, path, dates[0], dates[-1])
+        plans_file_items = task_lists.load_plans_file_items(config, path)
 
+    plans = plan_calendar.PlanCalendar(plans_file_items)
 
-def __show_today(tasks, plans, state, timesheet, logs) -> None:
-    date = utils.get_date_of_today()
-    __print_tasks_by_date(date, tasks, plans, state, timesheet, logs)
-    echo.line()
+    if len(dates) > 1:
+        plans.prepare(dates[0], dates[-1])
 
+    with echo.buffered(pager):
+        for date in dates:
+            __print_tasks_by_date(date, tasks, plans, state, timesheet, logs)
+            echo.line()
 
-def __show_last_n_days(tasks, plans, state, days_number: int, timesheet, logs) -> None:
-    date = utils.get_date_of_today() - datetime.timedelta(days=days_number)
-    for _ in range(days_number):
-        __print_tasks_by_date(date, tasks, plans, state, timesheet, logs)
-        date += datetime.timedelta(days=1)
-        echo.line()
 
+def __get_dates(period: str, value: str) -> list[datetime.date]:
+    """
+    Returns dates to show tasks for, in ascending order.
+    """
 
-def __show_next_n_days(tasks, plans, state, days_number: int, timesheet, logs) -> None:
-    date = utils.get_date_of_today()
-    for _ in range(days_number):
-        date += datetime.timedelta(days=1)
-        __print_tasks_by_date(date, tasks, plans, state, timesheet, logs)
-        echo.line()
+    today = utils.get_date_of_today()
 
+    if period == "today":
+        dates = [today]
+    elif period == "last":
+        days_number = int(value) if value else 1
+        dates = [today - datetime.timedelta(days=n) for n in range(days_number, 0, -1)]
+    elif period == "next":
+        days_number = int(value) if value else 1
+        dates = [today + datetime.timedelta(days=n) for n in range(1, days_number + 1)]
+    elif period == "date":
+        dates = [utils.get_date_from_string(value)]
+    else:
+        dates = []
 
-def __show_date(tasks, plans, state, date: str, timesheet, logs) -> None:
-    date = utils.get_date_from_string(date)
-    __print_tasks_by_date(date, tasks, plans, state, timesheet, logs)
-    echo.line()
+    return dates
 
 
+@profiler.timed("rendering")
 def __print_tasks_by_date(date, tasks, plans, state, timesheet, logs) -> None:
     title = utils.get_string_from_date(date)
 
     echo.title(f"# {title}")
     echo.title()
 
-    tasks_list = task_lists.get_tasks_list_by_date(tasks, date)
-
-    if tasks_list is None:
-        tasks.append(list_todo.ListTodo(f"# {title}"))
-        tasks_list = tasks[-1]
-
-    if date > state["last_planning_date"]:
-        task_lists.fill_tasks_list(tasks_list, plans)
+    tasks_list = __get_tasks_list(date, tasks, plans, state)
 
     if tasks_list.items:
         for task in tasks_list.items:
@@ -97,5 +104,23 @@ def __print_tasks_by_date(date, tasks, plans, state, timesheet, logs) -> None:
         echo.line("No tasks found.")
 
 
+def __get_tasks_list(date, tasks, plans, state) -> list_todo.ListTodo:
+    """
+    Returns a task list of a date with the tasks planned for the date (unless
+    they are made already). The task lists loaded are not changed.
+    """
+
+    tasks_list = list_todo.ListTodo(f"# {utils.get_string_from_date(date)}")
+    loaded_tasks_list = task_lists.get_tasks_list_by_date(tasks, date)
+
+    if loaded_tasks_list is not None:
+        tasks_list.items = list(loaded_tasks_list.items)
+
+    if date > state["last_planning_date"]:
+        task_lists.fill_tasks_list(tasks_list, plans)
+
+    return tasks_list
+
+
 if __name__ == "__main__":
     main(period="today", value="", path="", timesheet=False, logs=True)
@@ -2,15 +2,34 @@
 
 """Checks data directory for different issues."""
 
+import calendar
+import concurrent.futures
+import datetime
 import logging
+import os
 
-from todozer import echo, scheduler, task_lists, utils
+from todozer import (
+    echo,
+    plan_calendar,
+    plan_matrix,
+    profiler,
+    scheduler,
+    task_lists,
+    utils,
+)
 from todozer.todo import list_todo, plan_todo
 
+# Plans files with more plans are checked over a horizon by a pool of processes.
+PARALLEL_PLANS_NUMBER = 2000
 
-def main(path: str) -> None:
+
+def main(path: str, horizon: int = 0) -> None:
     """
     Checks plans file for errors.
+
+    In case a horizon is given, every plan is also simulated for the given number
+    of days (starting today) to find plans which never happen, and plans of the same
+    task which happen on the same days.
     """
 
     echo.line(f"Working directory: {path}")
@@ -24,6 +43,10 @@ def main(path: str) -> None:
     plans_file_issues = []
 
     __check_plans_file_items(plans_file_items, plans_file_issues)
+
+    if horizon > 0:
+        __check_plans_over_horizon(plans_file_items, plans_file_issues, horizon)
+
     __print_report(plans_file_issues, config)
 
 
@@ -43,6 +66,7 @@ def __print_report(plans_file_issues, config) -> None:
     echo.line()
 
 
+@profiler.timed("scheduling")
 def __check_plans_file_items(plans_file_items: list, plans_file_issues: list):
     today = utils.get_date_of_today()
 
@@ -61,5 +85,172 @@ def __check_plans_file_items(plans_file_items: list, plans_file_issues: list):
                 plans_file_issues.append(issue_text)
 
 
+@profiler.timed("scheduling")
+def __check_plans_over_horizon(
+    plans_file_items: list, plans_file_issues: list, horizon: int
+) -> None:
+    """
+    Checks every plan over a number of days: a plan is reported in case it is never
+    planned (although its pattern implies it should be planned in that time),
+    and plans of the same task are reported in case they fall on the same days,
+    so the task would be added to a tasks list twice.
+
+    Large plans files are split into chunks checked by a pool of processes.
+    """
+
+    plans = plan_calendar.PlanCalendar(plans_file_items).plans
+    plans_lines = [plan.lines for plan in plans]
+
+    start = utils.get_date_of_today()
+    end = start + datetime.timedelta(days=horizon - 1)
+
+    workers_number = os.cpu_count() or 1
+
+    if len(plans_lines) < PARALLEL_PLANS_NUMBER or workers_number == 1:
+        plans_file_issues.extend(get_horizon_issues(plans_lines, start, end))
+
+    else:
+        chunk_size = -(-len(plans_lines) // workers_number)
+        chunks = [
+            plans_lines[index : index + chunk_size]
+            for index in range(0, len(plans_lines), chunk_size)
+        ]
+
+        with concurrent.futures.ProcessPoolExecutor(workers_number) as executor:
+            results = executor.map(
+                get_horizon_issues, chunks, [start] * len(chunks), [end] * len(chunks)
+            )
+
+            for issues in results:
+                plans_file_issues.extend(issues)
+
+    plans_file_issues.extend(__get_duplicates_issues(plans, start, end))
+
+
+def get_horizon_issues(
+    plans_lines: list[list[str]], start: datetime.date, end: datetime.date
+) -> list[str]:
+    """
+    Returns issues of plans (given by their lines) found over days from start to end
+    (both inclusive). Plans are passed as lines, so the function can be called
+    in another process.
+    """
+
+    plans = []
+
+    for lines in plans_lines:
+        plan = plan_todo.PlanTodo(lines[0])
+        plan.lines.extend(lines[1:])
+
+        plans.append(plan)
+
+    rules = [scheduler.get_rule(plan) for plan in plans]
+    hits_numbers = plan_matrix.get_hits_numbers(rules, start, end)
+    horizon = (end - start).days + 1
+
+    issues = []
+
+    for plan, rule, hits_number in zip(plans, rules, hits_numbers):
+        if isinstance(rule, scheduler.ExactDatePattern):
+            if rule.exact_date < start:
+                issues.append(f'Task "{plan.title}" is planned for a date in the past')
+
+            continue
+
+        max_gap = __get_max_gap(rule)
+
+        if max_gap is None or hits_number > 0:
+            continue
+
+        # Days of the horizon the plan is able to be planned for.
+        first = start if rule.start_date is None else max(start, rule.start_date)
+        days_number = (end - first).days + 1
+
+        if not __is_possible(rule) or days_number >= max_gap:
+            issues.append(
+                f'Task "{plan.title}" is never planned in the next {horizon} days'
+            )
+
+    return issues
+
+
+def __get_duplicates_issues(
+    plans: list[plan_todo.PlanTodo], start: datetime.date, end: datetime.date
+) -> list[str]:
+    plans_by_titles = {}
+
+    for plan in plans:
+        plans_by_titles.setdefault(plan.title, []).append(plan)
+
+    horizon = (end - start).days + 1
+    issues = []
+
+    for title, title_plans in plans_by_titles.items():
+        if len(title_plans) < 2:
+            continue
+
+        rules = [scheduler.get_rule(plan) for plan in title_plans]
+        matches = plan_matrix.get_matches(rules, start, end)
+        days_number = sum(len(rule_indexes) > 1 for rule_indexes in matches)
+
+        if days_number > 0:
+            issues.append(
+                f'Task "{title}" is planned more than once'
+                f" on {days_number} of the next {horizon} days"
+            )
+
+    return issues
+
+
+def __is_possible(rule: scheduler.BasicPattern) -> bool:
+    """
+    Returns False in case a rule is bound to a day which doesn't exist
+    (like February 30), so it never matches whatever the horizon is.
+    """
+
+    if isinstance(rule, scheduler.EveryMonthPattern):
+        result = rule.day == "last" or 1 <= rule.day <= 31
+
+    elif isinstance(rule, scheduler.EveryYearPattern):
+        # 2000 is a leap year, so February 29 is possible.
+        result = 1 <= rule.day <= calendar.monthrange(2000, rule.month)[1]
+
+    else:
+        result = True
+
+    return result
+
+
+def __get_max_gap(rule: scheduler.BasicPattern) -> int | None:
+    """
+    Returns the longest number of days between dates a rule is supposed to match,
+    or None in case it is not known.
+    """
+
+    if isinstance(rule, scheduler.EveryDayPattern):
+        max_gap = 1
+
+    elif isinstance(rule, scheduler.EveryWeekdayPattern):
+        max_gap = 3
+
+    elif isinstance(rule, scheduler.EveryNDayPattern):
+        max_gap = rule.day_number if rule.day_number > 0 else None
+
+    elif isinstance(rule, scheduler.EveryDayOfWeek):
+        max_gap = 7 * rule.day_number if rule.day_number > 0 else None
+
+    elif isinstance(rule, scheduler.EveryMonthPattern):
+        # Days after the 28th are skipped in short months.
+        max_gap = 31 if rule.day == "last" or rule.day <= 28 else 62
+
+    elif isinstance(rule, scheduler.EveryYearPattern):
+        max_gap = 366 * 4 if (rule.month, rule.day) == (2, 29) else 366
+
+    else:
+        max_gap = None
+
+    return max_gap
+
+
 if __name__ == "__main__":
     main(path="")
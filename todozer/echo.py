@@ -1,25 +1,66 @@
+import contextlib
+from collections.abc import Iterator
+
 import click
 
+# Lines to output at once, while output is buffered (see buffered).
+__buffer: list[str] | None = None
+
+
+@contextlib.contextmanager
+def buffered(pager: bool = False) -> Iterator[None]:
+    """
+    Collects lines echoed inside it and outputs them at once (via a pager,
+    in case it is required), which is much faster than echoing lines one by one.
+    """
+
+    global __buffer
+
+    __buffer = []
+
+    try:
+        yield
+
+        lines = __buffer
+
+    finally:
+        __buffer = None
+
+    if not lines:
+        return
+
+    if pager:
+        click.echo_via_pager("\n".join(lines) + "\n")
+    else:
+        click.echo("\n".join(lines))
+
 
 def line(text: str = "") -> None:
-    click.echo(text)
+    __echo(text)
 
 
 def title(text: str = "") -> None:
-    click.echo(click.style(text=text, bold=True))
+    __echo(click.style(text=text, bold=True))
 
 
 def error(text: str = "") -> None:
-    click.echo(click.style(text=text, fg="red"))
+    __echo(click.style(text=text, fg="red"))
 
 
 def warning(text: str = "") -> None:
-    click.echo(click.style(text=text, fg="yellow"))
+    __echo(click.style(text=text, fg="yellow"))
 
 
 def success(text: str = "") -> None:
-    click.echo(click.style(text=text, fg="green"))
+    __echo(click.style(text=text, fg="green"))
 
 
 def comment(text: str = "") -> None:
-    click.echo(click.style(text=text, fg="bright_black"))
+    __echo(click.style(text=text, fg="bright_black"))
+
+
+def __echo(text) -> None:
+    if __buffer is None:
+        click.echo(text)
+    else:
+        __buffer.append(str(text))
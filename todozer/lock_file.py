@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+"""An advisory lock of the app's working directory, shared by all the app's commands."""
+
+import contextlib
+import logging
+import os
+from collections.abc import Iterator
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+def get_lock_file_path(path: str | None) -> str:
+    """Returns the app's lock file name."""
+
+    filename = "todozer.lock"
+
+    if path is not None:
+        filename = os.path.join(path, filename)
+
+    return filename
+
+
+@contextlib.contextmanager
+def lock(path: str | None, shared: bool = False) -> Iterator[None]:
+    """
+    Locks the working directory while data files are read (a shared lock)
+    or changed (an exclusive lock), waiting for other processes of the app
+    to release it first. The lock is released if a process dies.
+
+    On Windows, a shared lock is exclusive as well. Locks are not reentrant,
+    so a process must not lock the directory it has locked already.
+
+    A shared lock opens the lock file for reading only. In case there is no such
+    file and it cannot be created (e.g. the directory is read-only), data files
+    are read without a lock: nobody is able to change them there, anyway.
+    """
+
+    lock_file = __open(get_lock_file_path(path), shared)
+
+    if lock_file is None:
+        yield
+        return
+
+    with lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            __lock_on_windows(lock_file)
+
+        try:
+            yield
+
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def __open(file_name: str, shared: bool):
+    if shared:
+        try:
+            return open(file_name, "rb")
+        except FileNotFoundError:
+            pass
+
+        try:
+            return open(file_name, "a+b")
+        except OSError as error:
+            logging.debug(f"Reading data files without a lock: {error}")
+            return None
+
+    return open(file_name, "a+b")
+
+
+def __lock_on_windows(lock_file) -> None:
+    while True:
+        lock_file.seek(0)
+
+        try:
+            # It gives up after 10 attempts made once a second.
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+
+        except OSError:
+            continue
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+
+"""Delivers notifications to a user without blocking the app while doing it."""
+
+import abc
+import asyncio
+import configparser
+import datetime
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+
+import requests
+import requests.adapters
+
+from todozer import constants, echo
+
+TELEGRAM_API_URL = "https://api.telegram.org"
+
+# The longest message Telegram accepts.
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+
+class DeliveryError(Exception):
+    """A message is rejected by its recipient, so there is no point to retry."""
+
+
+class RetryLaterError(Exception):
+    """A recipient is busy and tells how many seconds to wait before a retry."""
+
+    retry_after: float
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+
+        self.retry_after = retry_after
+
+
+def get_messages(texts: list[str], max_length: int, separator: str = "\n") -> list[str]:
+    """
+    Joins texts into as few messages as possible, each one no longer than
+    the maximum length. A text which is longer than that is split.
+    """
+
+    messages = []
+    message = ""
+
+    for text in texts:
+        for start in range(0, len(text), max_length):
+            part = text[start : start + max_length]
+
+            if message and len(message) + len(separator) + len(part) <= max_length:
+                message += separator + part
+            else:
+                if message:
+                    messages.append(message)
+
+                message = part
+
+    if message:
+        messages.append(message)
+
+    return messages
+
+
+def get_notifier(config: configparser.ConfigParser, path: str | None):
+    """
+    Returns a notifier of the backend chosen in the app's settings.
+    """
+
+    backend = config.get("NOTIFICATIONS", "backend")
+    max_message_length = config.getint("NOTIFICATIONS", "max_message_length")
+
+    if backend == "telegram":
+        result = TelegramNotifier(
+            config.get("NOTIFICATIONS", "telegram_bot_api_token"),
+            config.get("NOTIFICATIONS", "telegram_chat_id"),
+            max_message_length=max_message_length,
+        )
+
+    elif backend == "webhook":
+        result = WebhookNotifier(
+            config.get("NOTIFICATIONS", "webhook_url"),
+            max_message_length=max_message_length,
+        )
+
+    elif backend == "file":
+        file_name = config.get("NOTIFICATIONS", "sink_file_name")
+
+        if path is not None:
+            file_name = os.path.join(path, file_name)
+
+        result = FileNotifier(file_name, max_message_length=max_message_length)
+
+    elif backend == "desktop":
+        result = DesktopNotifier(max_message_length=max_message_length)
+
+    else:
+        raise ValueError(f"Unknown notifications backend: {backend}")
+
+    return result
+
+
+def get_desktop_command(message: str, system: str) -> list[str] | None:
+    """
+    Returns a command to show a desktop notification on a system (as returned
+    by platform.system(), in lower case), or None in case it is not possible.
+
+    A message is passed to osascript as an argument of its script, not as a part
+    of the script, so the message doesn't need to be quoted.
+    """
+
+    if system == "linux" and shutil.which("notify-send"):
+        command = ["notify-send", "Todozer", message]
+
+    elif system == "darwin":
+        command = [
+            "osascript",
+            "-e",
+            "on run argv",
+            "-e",
+            'display notification (item 1 of argv) with title "Todozer"',
+            "-e",
+            "end run",
+            message,
+        ]
+
+    else:
+        command = None
+
+    return command
+
+
+def get_retry_after(response: requests.Response) -> float | None:
+    """
+    Returns the number of seconds a server asks to wait before the next request:
+    Telegram tells it in the "parameters" of its answer, other servers do it
+    in the Retry-After header (the date form of the header is not supported).
+    """
+
+    try:
+        retry_after = response.json()["parameters"]["retry_after"]
+    except (ValueError, KeyError, TypeError):
+        retry_after = response.headers.get("Retry-After")
+
+    try:
+        return max(float(retry_after), 0.0)
+    except (ValueError, TypeError):
+        return None
+
+
+class Notifier(abc.ABC):
+    """
+    A basic class of notifiers, which deliver messages to a user.
+
+    Messages are put in a queue and delivered by a few workers at once, so a message
+    which is slow to deliver doesn't delay the others. A message is delivered
+    by the _deliver() method of a backend, which is called in a thread and raises
+    an exception in case of a failure. A failed delivery is retried several times,
+    waiting longer and longer before each attempt (or as long as a recipient asks
+    in a RetryLaterError), unless it is a DeliveryError.
+
+    A notifier is supposed to be used as an asynchronous context manager:
+    the workers run inside it. Messages queued are delivered before it is exited,
+    unless it takes longer than the drain timeout.
+    """
+
+    name = "notifier"
+
+    __max_message_length: int
+    __concurrency: int
+    __attempts: int
+    __backoff: float
+    __drain_timeout: float
+    __queue: asyncio.Queue | None
+    __workers: list
+
+    def __init__(
+        self,
+        max_message_length: int = TELEGRAM_MAX_MESSAGE_LENGTH,
+        concurrency: int = 4,
+        attempts: int = 3,
+        backoff: float = 1.0,
+        drain_timeout: float = 30.0,
+    ):
+        self.__max_message_length = max(1, max_message_length)
+        self.__concurrency = concurrency
+        self.__attempts = attempts
+        self.__backoff = backoff
+        self.__drain_timeout = drain_timeout
+        self.__queue = None
+        self.__workers = []
+
+    async def __aenter__(self):
+        self._open(self.__concurrency)
+
+        self.__queue = asyncio.Queue()
+        self.__workers = [
+            asyncio.create_task(self.__work()) for _ in range(self.__concurrency)
+        ]
+
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        try:
+            await asyncio.wait_for(self.__queue.join(), self.__drain_timeout)
+        except asyncio.TimeoutError:
+            logging.error(
+                f"Messages to {self.name} are not delivered"
+                f" in {self.__drain_timeout} seconds, they are dropped"
+            )
+
+        for worker in self.__workers:
+            worker.cancel()
+
+        await asyncio.gather(*self.__workers, return_exceptions=True)
+
+        self.__workers = []
+        self._close()
+
+    @property
+    def max_message_length(self) -> int:
+        """
+        Returns the longest message the notifier sends.
+        """
+
+        return self.__max_message_length
+
+    def send(self, text: str) -> None:
+        """
+        Queues a message to send; returns at once.
+        """
+
+        self.__queue.put_nowait(text)
+
+    def send_all(self, texts: list[str]) -> None:
+        """
+        Queues texts to send together, in as few messages as possible.
+        """
+
+        for message in get_messages(texts, self.__max_message_length):
+            self.send(message)
+
+    async def join(self) -> None:
+        """
+        Waits until all the messages queued are delivered (or failed to be delivered).
+        """
+
+        await self.__queue.join()
+
+    def _open(self, concurrency: int) -> None:
+        """
+        Prepares resources a backend needs to deliver messages.
+        """
+
+    def _close(self) -> None:
+        """
+        Releases resources of a backend.
+        """
+
+    @abc.abstractmethod
+    def _deliver(self, message: str) -> None:
+        """
+        Delivers a message; raises an exception if it is not possible.
+        """
+
+    async def __work(self) -> None:
+        while True:
+            message = await self.__queue.get()
+
+            try:
+                await self.__deliver(message)
+            finally:
+                self.__queue.task_done()
+
+    async def __deliver(self, message: str) -> None:
+        delay = 0.0
+
+        for attempt in range(self.__attempts):
+            if attempt > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                await asyncio.to_thread(self._deliver, message)
+                return
+
+            except DeliveryError as error:
+                logging.error(f"Error while sending a message to {self.name}: {error}")
+                return
+
+            except RetryLaterError as error:
+                logging.error(f"Error while sending a message to {self.name}: {error}")
+                delay = error.retry_after
+
+            except Exception as error:
+                logging.error(f"Error while sending a message to {self.name}: {error}")
+                delay = self.__backoff * 2**attempt
+
+
+class HttpNotifier(Notifier):
+    """
+    A basic class of notifiers which make HTTP requests. Requests are made
+    via a single HTTP session, which keeps connections alive between them.
+    """
+
+    _timeout: float
+    _session: requests.Session | None
+
+    def __init__(self, timeout: float = 10.0, **kwargs):
+        super().__init__(**kwargs)
+
+        self._timeout = timeout
+        self._session = None
+
+    def _open(self, concurrency: int) -> None:
+        self._session = requests.Session()
+
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def _close(self) -> None:
+        self._session.close()
+
+    @staticmethod
+    def _check_response(response: requests.Response) -> None:
+        """
+        Raises an exception if a request is failed; it is not retried
+        if it is rejected (unless the server is just busy).
+        """
+
+        if response.status_code >= 400:
+            if response.status_code == 429:
+                retry_after = get_retry_after(response)
+
+                if retry_after is not None:
+                    raise RetryLaterError(response.text, retry_after)
+
+            elif response.status_code < 500:
+                raise DeliveryError(response.text)
+
+            raise Exception(response.text)
+
+
+class TelegramNotifier(HttpNotifier):
+    """
+    Sends messages to a Telegram chat.
+    """
+
+    name = "Telegram"
+
+    __url: str
+    __chat_id: str
+
+    def __init__(
+        self,
+        bot_api_token: str,
+        chat_id: str,
+        api_url: str = TELEGRAM_API_URL,
+        max_message_length: int = TELEGRAM_MAX_MESSAGE_LENGTH,
+        **kwargs,
+    ):
+        max_message_length = min(max_message_length, TELEGRAM_MAX_MESSAGE_LENGTH)
+
+        super().__init__(max_message_length=max_message_length, **kwargs)
+
+        self.__url = f"{api_url}/bot{bot_api_token}/sendMessage"
+        self.__chat_id = chat_id
+
+    def _deliver(self, message: str) -> None:
+        data = {
+            "parse_mode": "HTML",
+            "chat_id": self.__chat_id,
+            "text": f"{message}",
+        }
+
+        response = self._session.post(self.__url, params=data, timeout=self._timeout)
+
+        self._check_response(response)
+
+
+class WebhookNotifier(HttpNotifier):
+    """
+    Posts messages to a URL as JSON objects like {"text": "..."}.
+    """
+
+    name = "webhook"
+
+    __url: str
+
+    def __init__(self, url: str, **kwargs):
+        super().__init__(**kwargs)
+
+        self.__url = url
+
+    def _deliver(self, message: str) -> None:
+        data = {"text": message}
+
+        response = self._session.post(self.__url, json=data, timeout=self._timeout)
+
+        self._check_response(response)
+
+
+class FileNotifier(Notifier):
+    """
+    Appends messages to a file (or a named pipe) as JSON lines like
+    {"time": "...", "text": "..."}, so another app can pick them up.
+    """
+
+    name = "file"
+
+    __file_name: str
+
+    def __init__(self, file_name: str, **kwargs):
+        # Lines written by several workers at once could be mixed up.
+        kwargs["concurrency"] = 1
+
+        super().__init__(**kwargs)
+
+        self.__file_name = file_name
+
+    def _deliver(self, message: str) -> None:
+        data = {"time": datetime.datetime.now().isoformat(), "text": message}
+
+        with open(self.__file_name, "a", encoding=constants.ENCODING) as file:
+            file.write(f"{json.dumps(data, ensure_ascii=False)}\n")
+
+
+class DesktopNotifier(Notifier):
+    """
+    Shows messages as desktop notifications (using notify-send on Linux
+    or osascript on macOS) or, if it is not possible, prints them
+    to the console with a beep.
+    """
+
+    name = "desktop"
+
+    def __init__(self, **kwargs):
+        kwargs["concurrency"] = 1
+
+        super().__init__(**kwargs)
+
+    def _deliver(self, message: str) -> None:
+        command = get_desktop_command(message, platform.system().lower())
+
+        if command is not None:
+            subprocess.run(command, check=True)
+        else:
+            echo.line(f"\a🔔 {message}")
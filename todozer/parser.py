@@ -1,55 +1,200 @@
 #!/usr/bin/env python3
 
+import datetime
+import re
+from collections.abc import Iterable, Iterator
+
 from todozer import constants
 from todozer.todo import list_todo, plan_todo, task_todo, text_todo
 
+LIST_LINE = "list"
+TASK_LINE = "task"
+EMPTY_LINE = "empty"
+TEXT_LINE = "text"
+
+# Classifies a line of a data file at once; the name of a group matched is the
+# line's kind. It is the same as ListTodo.match(), TaskTodo.match() and an empty
+# line check, applied one by one.
+LINE_REGEXP = re.compile(
+    rf"(?P<{LIST_LINE}># )|(?P<{TASK_LINE}>-\s*\[[\s\S]\])|(?P<{EMPTY_LINE}>\s*$)"
+)
+
+
+# Finds list headers in a file's content; a header's date is captured, if there is one.
+SECTION_REGEXP = re.compile(
+    rb"^# (?:([0-9]{4})-([0-9]{1,2})-([0-9]{1,2}))?", flags=re.MULTILINE
+)
+
+
+def get_sections_index(data: bytes) -> list[tuple[int | None, int, int]]:
+    """
+    Returns a list of (date, start, end) tuples for every list in a file's content:
+    an ordinal of the list's date (None for a list without a date) and
+    a range of bytes the list occupies, from its header to the next list's one.
+    """
+
+    index = []
+
+    headers = list(SECTION_REGEXP.finditer(data))
+    ends = [header.start() for header in headers[1:]] + [len(data)]
+
+    for header, end in zip(headers, ends):
+        date = None
+
+        if header[1] is not None:
+            try:
+                date = datetime.date(
+                    int(header[1]), int(header[2]), int(header[3])
+                ).toordinal()
+            except ValueError:
+                pass
+
+        index.append((date, header.start(), end))
+
+    return index
+
+
+# Finds empty lines at the end of a section, along with the line break before them.
+TRAILING_LINES_REGEXP = re.compile(rb"(?:\r\n|\r|\n)\s*\Z")
+
+
+def decode(data: bytes) -> str:
+    """
+    Decodes a file's content, translating line breaks the same way as reading a file
+    in text mode does.
+    """
+
+    return data.decode(constants.ENCODING).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def tokenize(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """
+    Yields a kind of every line given along with the line itself.
+    """
+
+    match = LINE_REGEXP.match
+
+    for line in lines:
+        match_object = match(line)
+
+        yield TEXT_LINE if match_object is None else match_object.lastgroup, line
+
 
 class Parser:
     __file_path: str = ""
     __last_list: list_todo.ListTodo | None
     __file_items: list = []
     __task_class = None
-    __empty_lines: list = []
 
     def __init__(self, file_path: str, task_class):
         self.__file_path = file_path
         self.__last_list = None
         self.__file_items = []
         self.__task_class = task_class
-        self.__empty_lines = []
 
     def parse(self) -> list:
-        tasks_file = open(self.__file_path, "r", encoding=constants.ENCODING)
+        with open(self.__file_path, "r", encoding=constants.ENCODING) as tasks_file:
+            lines = tasks_file.read().split("\n")
+
+        return list(self.__read(lines))
+
+    def sections(
+        self,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+        index: list[tuple[int | None, int, int]] | None = None,
+    ) -> Iterator:
+        """
+        Yields top-level items of the file (task lists, mostly) one by one, reading
+        the file lazily, so a caller may stop as soon as it has got the items it needs.
+
+        In case a period is given, only the lists dated within it are yielded. They are
+        located using a sections index (see get_sections_index), so only their bytes
+        are read and parsed. The index is built from the file's content, unless it is
+        given (from a cache, for instance).
+        """
+
+        if start is None and end is None:
+            with open(self.__file_path, "r", encoding=constants.ENCODING) as file:
+                yield from self.__read(line.rstrip("\n") for line in file)
 
-        with tasks_file:
-            while True:
-                line = tasks_file.readline()
+        else:
+            start = datetime.date.min if start is None else start
+            end = datetime.date.max if end is None else end
 
-                if not line:
-                    break
+            with open(self.__file_path, "rb") as file:
+                if index is None:
+                    index = get_sections_index(file.read())
 
-                line = line.rstrip("\n")
+                for date, section_start, section_end in index:
+                    if (
+                        date is not None
+                        and start <= datetime.date.fromordinal(date) <= end
+                    ):
+                        file.seek(section_start)
+                        section = decode(file.read(section_end - section_start))
 
-                if list_todo.ListTodo.match(line):
-                    self.__add_date(line)
-                elif self.__task_class.match(line):
-                    self.__add_task(line)
-                elif line.strip() != "":
-                    self.__add_text(line)
+                        yield from self.__read(section.split("\n"))
 
-        return self.__file_items
+    def parse_sections(self) -> Iterator[tuple[object, tuple[int, int] | None]]:
+        """
+        Yields all top-level items of the file, the same as parse() returns, each one
+        along with a range of bytes of the file it was read from.
 
-    def __add_date(self, line: str):
-        self.__add_empty_lines_to_last_date()
+        The range covers the item's section from its header up to the last non-empty line,
+        so empty lines between sections are not included. It is None for items which
+        do not occupy a section by themselves (text before the first list, for instance).
+        """
+
+        with open(self.__file_path, "rb") as file:
+            data = file.read()
+
+        index = get_sections_index(data)
+
+        spans = [(0, index[0][1] if index else len(data))]
+        spans += [(start, end) for _, start, end in index]
+
+        for start, end in spans:
+            section = data[start:end]
+            items = list(self.__read(decode(section).split("\n")))
+
+            trailing_lines = TRAILING_LINES_REGEXP.search(section)
+
+            if trailing_lines is not None:
+                end = start + trailing_lines.start()
+
+            for item in items:
+                yield item, (start, end) if len(items) == 1 else None
+
+    def __read(self, lines: Iterable[str]) -> Iterator:
+        for kind, line in tokenize(lines):
+            if kind == LIST_LINE:
+                yield from self.__pop_file_items()
+                self.__add_date(line)
+            elif kind == TASK_LINE:
+                self.__add_task(line)
+            elif kind == TEXT_LINE:
+                self.__add_text(line)
+
+        yield from self.__pop_file_items()
+
+    def __pop_file_items(self) -> list:
+        """
+        Returns items which are read completely, so the parser may forget about them.
+        """
 
+        file_items = self.__file_items
+        self.__file_items = []
+
+        return file_items
+
+    def __add_date(self, line: str):
         new_item = list_todo.ListTodo(line)
 
         self.__file_items.append(new_item)
         self.__last_list = new_item
 
     def __add_task(self, line: str):
-        self.__add_empty_lines_to_last_date()
-
         if self.__last_list is None:
             self.__file_items.append(text_todo.TextTodo(line))
         else:
@@ -59,21 +204,15 @@ class Parser:
         previous_task = self.__get_previous_task()
 
         if previous_task is not None:
-            self.__add_empty_lines(previous_task.lines)
-
             previous_task.lines.append(line)
 
         else:
             new_item = text_todo.TextTodo(line)
 
             if self.__last_list is not None:
-                self.__add_empty_lines(self.__last_list.items)
-
                 self.__last_list.items.append(new_item)
 
             else:
-                self.__add_empty_lines(self.__file_items)
-
                 self.__file_items.append(new_item)
 
     def __get_previous_task(self) -> task_todo.TaskTodo | plan_todo.PlanTodo | None:
@@ -91,15 +230,3 @@ class Parser:
                 previous_task = last_file_item
 
         return previous_task
-
-    def __add_empty_lines_to_last_date(self) -> None:
-        self.__add_empty_lines(
-            self.__file_items if self.__last_list is None else self.__last_list.items
-        )
-
-    def __add_empty_lines(self, collection) -> None:
-        for empty_line in self.__empty_lines:
-            new_item = text_todo.TextTodo(empty_line)
-            collection.append(new_item)
-
-        self.__empty_lines.clear()
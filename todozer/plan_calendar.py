@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+"""A calendar of plans, which allows to find plans for a date without checking all of them."""
+
+import datetime
+
+from todozer import cache_file, constants, plan_matrix, profiler, scheduler, utils
+from todozer.todo import list_todo, plan_todo
+
+
+class PlanCalendar:
+    """
+    Plans of a plans file, bucketed by the days they are able to match.
+
+    Every plan is placed to a bucket according to its rule: exact dates, days of week,
+    days of month, days of year, strides of N days or every day. To find plans
+    for a date, only plans from the buckets of the date are checked.
+
+    Plans for a whole period (e.g. a week to notify about) can be found at once
+    in advance by the prepare() method, which is much faster for long periods.
+    """
+
+    __plans: list
+    __exact_dates: dict
+    __week_days: dict
+    __month_days: dict
+    __year_days: dict
+    __strides: dict
+    __every_day: list
+    __plans_by_date: dict
+    __fingerprint: str
+
+    @profiler.timed("scheduling")
+    def __init__(self, plans_file_items: list):
+        self.__plans = []
+        self.__exact_dates = {}
+        self.__week_days = {}
+        self.__month_days = {}
+        self.__year_days = {}
+        self.__strides = {}
+        self.__every_day = []
+        self.__plans_by_date = {}
+
+        self.__add_items(plans_file_items)
+
+        lines = "\n".join("\n".join(plan.lines) for plan in self.__plans)
+        self.__fingerprint = cache_file.get_digest(lines.encode(constants.ENCODING))
+
+    @property
+    def plans(self) -> list[plan_todo.PlanTodo]:
+        """
+        Returns all the plans of the calendar in order of the plans file.
+        """
+
+        return self.__plans
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Returns a hash of the plans' lines, which is the same for calendars
+        of the same plans.
+        """
+
+        return self.__fingerprint
+
+    def get_plans(self, date: datetime.date) -> list[plan_todo.PlanTodo]:
+        """
+        Returns plans scheduled for a date in order of the plans file.
+        """
+
+        if date in self.__plans_by_date:
+            return list(self.__plans_by_date[date])
+
+        candidates = self.__exact_dates.get(date, []) + self.__every_day
+        candidates += self.__week_days.get(date.weekday(), [])
+        candidates += self.__month_days.get(date.day, [])
+        candidates += self.__year_days.get((date.month, date.day), [])
+
+        if date == utils.get_month_last_day_date(date):
+            candidates += self.__month_days.get("last", [])
+
+        ordinal = date.toordinal()
+
+        for step in self.__strides:
+            candidates += self.__strides[step].get(ordinal % step, [])
+
+        return [
+            plan
+            for _, plan in sorted(candidates)
+            if scheduler.get_rule(plan).match_date(date)
+        ]
+
+    @profiler.timed("scheduling")
+    def prepare(self, start: datetime.date, end: datetime.date) -> None:
+        """
+        Finds plans scheduled for every day from start to end (both inclusive)
+        by matching all the plans against the whole period at once (see plan_matrix).
+        """
+
+        rules = [scheduler.get_rule(plan) for plan in self.__plans]
+        date = start
+
+        for indexes in plan_matrix.get_matches(rules, start, end):
+            self.__plans_by_date[date] = [self.__plans[index] for index in indexes]
+            date += datetime.timedelta(days=1)
+
+    def __add_items(self, items: list) -> None:
+        for item in items:
+            if isinstance(item, list_todo.ListTodo):
+                self.__add_items(item.items)
+
+            elif isinstance(item, plan_todo.PlanTodo):
+                self.__add_plan(item)
+
+    def __add_plan(self, plan: plan_todo.PlanTodo) -> None:
+        entry = (len(self.__plans), plan)
+
+        self.__plans.append(plan)
+
+        rule = scheduler.get_rule(plan)
+
+        if isinstance(rule, scheduler.ExactDatePattern):
+            self.__exact_dates.setdefault(rule.exact_date, []).append(entry)
+
+        elif isinstance(rule, scheduler.EveryDayOfWeek):
+            self.__week_days.setdefault(rule.day_index, []).append(entry)
+
+        elif isinstance(rule, scheduler.EveryWeekdayPattern):
+            for day_index in range(5):
+                self.__week_days.setdefault(day_index, []).append(entry)
+
+        elif isinstance(rule, scheduler.EveryMonthPattern):
+            self.__month_days.setdefault(rule.day, []).append(entry)
+
+        elif isinstance(rule, scheduler.EveryYearPattern):
+            self.__year_days.setdefault((rule.month, rule.day), []).append(entry)
+
+        elif isinstance(rule, scheduler.EveryNDayPattern) and rule.day_number > 0:
+            step = rule.day_number
+            strides = self.__strides.setdefault(step, {})
+            strides.setdefault(rule.start_date.toordinal() % step, []).append(entry)
+
+        elif isinstance(rule, scheduler.EveryDayPattern):
+            self.__every_day.append(entry)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+
+"""
+Matches rules of plans against every day of a period at once.
+
+In case NumPy is available, the days of the period are turned into arrays (of ordinals,
+days of week, days of month and months), and every rule is tested against all the days
+in a single vectorized operation. Otherwise, dates of every rule are enumerated
+by its occurrences() method, which is slower, but gives the same result.
+"""
+
+import datetime
+
+from todozer import scheduler
+
+# NumPy is imported only when a period is matched the first time,
+# since it would slow down the app's start (see get_engine).
+__numpy = None
+
+
+def get_engine() -> str:
+    """
+    Returns the name of the engine available: "numpy" or "python".
+    """
+
+    global __numpy
+
+    if __numpy is None:
+        try:
+            import numpy
+
+            __numpy = numpy
+        except ImportError:
+            __numpy = False
+
+    return "numpy" if __numpy else "python"
+
+
+def get_matrix(
+    rules: list[scheduler.BasicPattern],
+    start: datetime.date,
+    end: datetime.date,
+    engine: str | None = None,
+) -> list:
+    """
+    Returns a matrix of rules × days from start to end (both inclusive), which tells
+    whether a rule matches a day: a NumPy array of booleans (in case of the "numpy"
+    engine) or a list of lists of booleans.
+    """
+
+    engine = engine or get_engine()
+
+    if engine == "numpy" and get_engine() == "numpy":
+        matrix = __get_matrix_numpy(rules, start, end)
+    else:
+        matrix = __get_matrix_python(rules, start, end)
+
+    return matrix
+
+
+def get_hits_numbers(
+    rules: list[scheduler.BasicPattern],
+    start: datetime.date,
+    end: datetime.date,
+    engine: str | None = None,
+) -> list[int]:
+    """
+    Returns the number of days from start to end (both inclusive) every rule matches.
+    """
+
+    matrix = get_matrix(rules, start, end, engine)
+
+    if isinstance(matrix, list):
+        return [sum(row) for row in matrix]
+
+    return matrix.sum(axis=1).tolist()
+
+
+def get_matches(
+    rules: list[scheduler.BasicPattern],
+    start: datetime.date,
+    end: datetime.date,
+    engine: str | None = None,
+) -> list[list[int]]:
+    """
+    Returns indexes of the rules which match every day from start to end
+    (both inclusive), in ascending order.
+    """
+
+    matrix = get_matrix(rules, start, end, engine)
+    matches = [[] for _ in range((end - start).days + 1)]
+
+    if isinstance(matrix, list):
+        for rule_index, row in enumerate(matrix):
+            for day_index, is_matched in enumerate(row):
+                if is_matched:
+                    matches[day_index].append(rule_index)
+
+    else:
+        # Indexes are sorted by days first, then by rules.
+        day_indexes, rule_indexes = matrix.T.nonzero()
+
+        for day_index, rule_index in zip(day_indexes.tolist(), rule_indexes.tolist()):
+            matches[day_index].append(rule_index)
+
+    return matches
+
+
+def __get_matrix_python(rules: list, start: datetime.date, end: datetime.date) -> list:
+    matrix = []
+
+    for rule in rules:
+        row = [False] * ((end - start).days + 1)
+
+        for date in rule.occurrences(start, end):
+            row[(date - start).days] = True
+
+        matrix.append(row)
+
+    return matrix
+
+
+def __get_matrix_numpy(rules: list, start: datetime.date, end: datetime.date):
+    numpy = __numpy
+
+    dates = numpy.arange(start, end + datetime.timedelta(days=1), dtype="datetime64[D]")
+    months = dates.astype("datetime64[M]")
+
+    days = {
+        "ordinal": dates.astype("int64") + datetime.date(1970, 1, 1).toordinal(),
+        "day": (dates - months).astype("int64") + 1,
+        "month": months.astype("int64") % 12 + 1,
+        "is_last": (dates + 1).astype("datetime64[M]") != months,
+    }
+
+    # January 1, 1 (the first ordinal) is Monday.
+    days["weekday"] = (days["ordinal"] - 1) % 7
+
+    matrix = numpy.zeros((len(rules), len(dates)), dtype=bool)
+
+    for index, rule in enumerate(rules):
+        matrix[index] = __get_mask(numpy, rule, days)
+
+    return matrix
+
+
+def __get_mask(numpy, rule: scheduler.BasicPattern, days: dict):
+    ordinal = days["ordinal"]
+
+    if rule.start_date is None:
+        mask = numpy.ones(len(ordinal), dtype=bool)
+    else:
+        mask = ordinal >= rule.start_date.toordinal()
+
+    if isinstance(rule, scheduler.ExactDatePattern):
+        mask = ordinal == rule.exact_date.toordinal()
+
+    elif isinstance(rule, scheduler.EveryDayPattern):
+        pass
+
+    elif isinstance(rule, scheduler.EveryNDayPattern):
+        step = rule.day_number
+
+        if step > 0:
+            mask &= (ordinal - rule.start_date.toordinal()) % step == 0
+        else:
+            mask[:] = False
+
+    elif isinstance(rule, scheduler.EveryDayOfWeek):
+        step = 7 * rule.day_number
+
+        if step > 0:
+            mask &= days["weekday"] == rule.day_index
+            mask &= (ordinal - rule.start_date.toordinal()) % step == 0
+        else:
+            mask[:] = False
+
+    elif isinstance(rule, scheduler.EveryWeekdayPattern):
+        mask &= days["weekday"] <= 4
+
+    elif isinstance(rule, scheduler.EveryMonthPattern):
+        if rule.day == "last":
+            mask &= days["is_last"]
+        else:
+            mask &= days["day"] == rule.day
+
+    elif isinstance(rule, scheduler.EveryYearPattern):
+        mask &= (days["day"] == rule.day) & (days["month"] == rule.month)
+
+    elif type(rule) is scheduler.BasicPattern:
+        mask[:] = False
+
+    else:
+        # A rule the engine doesn't know is matched day by day.
+        mask = numpy.array(
+            [
+                rule.match_date(datetime.date.fromordinal(value))
+                for value in ordinal.tolist()
+            ],
+            dtype=bool,
+        )
+
+    return mask
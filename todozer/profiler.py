@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+"""
+Measures how long phases of a command take (loading the config, parsing files,
+scheduling, etc.), when the app is run with the --profile option.
+"""
+
+import functools
+import time
+from typing import Callable
+
+import click
+
+# Times of phases by their names (None unless profiling is enabled).
+__timings: dict[str, list] | None = None
+
+# Phases being measured at the moment, the innermost one is the last.
+__stack: list[list] = []
+
+# cProfile is imported only when it is required, not to slow down the app's start.
+__profile = None
+
+__started_at: float = 0.0
+
+
+def start(with_cprofile: bool = False) -> None:
+    """
+    Enables measuring of phases; in case it is required, runs cProfile as well.
+    """
+
+    global __timings, __profile, __started_at
+
+    __timings = {}
+    __started_at = time.perf_counter()
+
+    if with_cprofile:
+        import cProfile
+
+        __profile = cProfile.Profile()
+        __profile.enable()
+
+
+def stop(file_name: str | None = None) -> None:
+    """
+    Disables profiling and prints the times of phases to stderr. cProfile statistics
+    (if any) are saved to a file, to be viewed by pstats or any other tool.
+    """
+
+    global __timings, __profile
+
+    if __profile is not None:
+        __profile.disable()
+
+        if file_name is not None:
+            __profile.dump_stats(file_name)
+
+        __profile = None
+
+    if __timings is not None:
+        __print_timings(__timings, time.perf_counter() - __started_at)
+
+        __timings = None
+
+
+def get_timings() -> dict[str, tuple[float, int]]:
+    """
+    Returns the time spent in every phase (in seconds) and the number of times
+    the phase has been entered, in order the phases are entered the first time.
+    """
+
+    return {name: tuple(timing) for name, timing in (__timings or {}).items()}
+
+
+def timed(phase: str) -> Callable:
+    """
+    Makes a decorator to measure how long a function takes as a part of a phase.
+
+    The time of a phase doesn't include phases measured inside it (e.g. scheduling
+    while rendering), so a time is never counted twice. The rest of the time
+    a command takes is reported as "other".
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if __timings is None:
+                return function(*args, **kwargs)
+
+            timing = __timings.setdefault(phase, [0.0, 0])
+            # The time the phase is entered and the time of phases inside it.
+            frame = [time.perf_counter(), 0.0]
+            __stack.append(frame)
+
+            try:
+                return function(*args, **kwargs)
+
+            finally:
+                __stack.pop()
+
+                elapsed = time.perf_counter() - frame[0]
+
+                if __stack:
+                    __stack[-1][1] += elapsed
+
+                timing[0] += elapsed - frame[1]
+                timing[1] += 1
+
+        return wrapper
+
+    return decorator
+
+
+def __print_timings(timings: dict, total: float) -> None:
+    click.echo(err=True)
+    click.echo(f"{'Phase':<20} {'Time, ms':>10} {'Calls':>7}", err=True)
+
+    for name, (seconds, calls) in timings.items():
+        click.echo(f"{name:<20} {seconds * 1000:>10.2f} {calls:>7}", err=True)
+
+    other = total - sum(seconds for seconds, _ in timings.values())
+
+    click.echo(f"{'other':<20} {other * 1000:>10.2f}", err=True)
+    click.echo(f"{'Total':<20} {total * 1000:>10.2f}", err=True)
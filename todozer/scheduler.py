@@ -1,13 +1,61 @@
 #!/usr/bin/env python3
 
+import calendar
 import datetime
 import enum
+import functools
 import logging
 import re
+from collections.abc import Iterator
 
 from todozer import utils
 from todozer.todo import plan_todo
 
+# Words of pattern texts (case-insensitive) and the words they are translated to.
+TRANSLATION_RULES = [
+    (" с ", " from "),
+    ("по будням|по будним дням", "every weekday"),
+    ("будний день", "weekday"),
+    ("день", "day"),
+    (" days", " day"),
+    ("месяц", "month"),
+    ("год", "year"),
+    ("дня|дней", "days"),
+    ("последний", "last"),
+    ("каждый|каждая|каждое|каждую|каждые", "every"),
+    ("январь|января|january", "jan"),
+    ("февраль|февраля|february", "feb"),
+    ("март|марта|march", "mar"),
+    ("апрель|апреля|april", "apr"),
+    ("май|мая|may", "may"),
+    ("июнь|июня|june", "jun"),
+    ("июль|июля|july", "jul"),
+    ("август|августа|august", "aug"),
+    ("сентябрь|сентября|september", "sep"),
+    ("октябрь|октября|october", "oct"),
+    ("ноябрь|ноября|november", "nov"),
+    ("декабрь|декабря|december", "dec"),
+    ("понедельник", "monday"),
+    ("вторник", "tuesday"),
+    ("среда|среду", "wednesday"),
+    ("четверг", "thursday"),
+    ("пятница|пятницу", "friday"),
+    ("суббота|субботу", "saturday"),
+    ("воскресенье", "sunday"),
+]
+
+TRANSLATIONS = {
+    word: translation
+    for words, translation in TRANSLATION_RULES
+    for word in words.split("|")
+}
+
+# The longest words go first, so a word is not replaced by a part of it.
+TRANSLATION_REGEXP = re.compile(
+    "|".join(re.escape(word) for word in sorted(TRANSLATIONS, key=len, reverse=True)),
+    flags=re.IGNORECASE,
+)
+
 
 class Pattern(enum.Enum):
     """Task repetition patterns."""
@@ -29,18 +77,81 @@ class Pattern(enum.Enum):
 
 
 class BasicPattern:
+    """
+    A plan's pattern compiled into a rule, which is able to tell whether a date matches it.
+
+    The basic class itself is the rule of a pattern which cannot be recognized,
+    so it never matches any date.
+    """
+
     name: Pattern = Pattern.NONE
     line: str
+    start_date: datetime.date | None
 
     def __init__(self, line: str):
         self.line = line
+        self.start_date = None
 
     def parse(self):
-        pass
+        self.start_date = self.get_start_date()
 
     def match(self):
         pass
 
+    def match_line(self) -> bool:
+        return False
+
+    def match_date(self, date: datetime.date) -> bool:
+        return False
+
+    def occurrences(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterator[datetime.date]:
+        """
+        Yields dates from start to end (both inclusive) which match the rule,
+        in ascending order.
+        """
+
+        yield from ()
+
+    def get_first_date(self, start: datetime.date) -> datetime.date:
+        """
+        Returns the first date of a window which is not earlier than the start date of the rule.
+        """
+
+        return start if self.start_date is None else max(start, self.start_date)
+
+    @staticmethod
+    def get_dates(
+        first: datetime.date, end: datetime.date, step: int = 1
+    ) -> Iterator[datetime.date]:
+        """
+        Yields every step-th date from first to end (both inclusive).
+        """
+
+        delta = datetime.timedelta(days=step)
+
+        while first <= end:
+            yield first
+            first += delta
+
+    @staticmethod
+    def get_stride_dates(
+        origin: datetime.date, step: int, start: datetime.date, end: datetime.date
+    ) -> Iterator[datetime.date]:
+        """
+        Yields dates from start to end (both inclusive) which are a multiple of step days
+        after the origin date.
+        """
+
+        first = origin
+
+        if first < start:
+            steps_number = -(-(start - first).days // step)
+            first += datetime.timedelta(days=steps_number * step)
+
+        yield from BasicPattern.get_dates(first, end, step)
+
     def match_title(self, regexp: str) -> bool:
         """
         Checks if a line equals the provided regexp.
@@ -49,14 +160,7 @@ class BasicPattern:
         return re.match(regexp, self.line, flags=re.IGNORECASE) is not None
 
     def match_start_date(self, date: datetime.date) -> bool:
-        result = True
-
-        start_date = self.get_start_date()
-
-        if start_date is not None:
-            result = date >= start_date
-
-        return result
+        return self.start_date is None or date >= self.start_date
 
     def get_start_date(self) -> datetime.date:
         date_regexp = utils.get_regexp_for_date()
@@ -85,6 +189,8 @@ class ExactDatePattern(BasicPattern):
         self.exact_date = None
 
     def parse(self):
+        super().parse()
+
         date_regexp = utils.get_regexp_for_date()
         full_regexp = f"({date_regexp}).*"
 
@@ -99,6 +205,12 @@ class ExactDatePattern(BasicPattern):
     def match_date(self, date: datetime.date) -> bool:
         return date == self.exact_date
 
+    def occurrences(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterator[datetime.date]:
+        if self.exact_date is not None and start <= self.exact_date <= end:
+            yield self.exact_date
+
 
 class EveryDayPattern(BasicPattern):
     """
@@ -115,6 +227,11 @@ class EveryDayPattern(BasicPattern):
     def match_date(self, date: datetime.date) -> bool:
         return self.match_start_date(date)
 
+    def occurrences(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterator[datetime.date]:
+        yield from self.get_dates(self.get_first_date(start), end)
+
 
 class EveryNDayPattern(BasicPattern):
     """
@@ -132,18 +249,18 @@ class EveryNDayPattern(BasicPattern):
         super().__init__(line)
 
         self.day_number = None
-        self.start_date = None
 
     def parse(self):
+        super().parse()
+
         regexp = ".*every ([0-9]+) day.*"
         groups = re.match(regexp, self.line, flags=re.IGNORECASE)
 
         if groups is not None:
             self.day_number = int(groups[1])
-            self.start_date = self.get_start_date()
 
     def match_line(self) -> bool:
-        return self.start_date is not None
+        return self.day_number is not None and self.start_date is not None
 
     def match_date(self, date: datetime.date) -> bool:
         return (
@@ -151,6 +268,14 @@ class EveryNDayPattern(BasicPattern):
             and abs(date - self.start_date).days % self.day_number == 0
         )
 
+    def occurrences(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterator[datetime.date]:
+        if self.day_number > 0:
+            yield from self.get_stride_dates(
+                self.start_date, self.day_number, start, end
+            )
+
 
 class EveryDayOfWeek(BasicPattern):
     """
@@ -162,13 +287,14 @@ class EveryDayOfWeek(BasicPattern):
         super().__init__(line)
 
         self.day_number = None
-        self.start_date = None
 
         self.day_name = None
         self.day_index = None
         self.abbreviated_day_name = None
 
     def parse(self):
+        super().parse()
+
         date_regexp = utils.get_regexp_for_date()
 
         regexp = f"every {self.day_name}"
@@ -176,7 +302,6 @@ class EveryDayOfWeek(BasicPattern):
 
         if groups is not None:
             self.day_number = 1
-            self.start_date = self.get_start_date()
 
             if self.start_date is None:
                 self.start_date = utils.get_previous_day_of_week(self.day_index)
@@ -187,7 +312,6 @@ class EveryDayOfWeek(BasicPattern):
 
             if groups is not None:
                 self.day_number = int(groups[1])
-                self.start_date = self.get_start_date()
 
     def match_line(self) -> bool:
         return self.day_number is not None and self.start_date is not None
@@ -196,9 +320,16 @@ class EveryDayOfWeek(BasicPattern):
         return (
             date >= self.start_date
             and abs(date - self.start_date).days / 7 % self.day_number == 0
-            and date.strftime("%a") == self.abbreviated_day_name
+            and date.weekday() == self.day_index
         )
 
+    def occurrences(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterator[datetime.date]:
+        if self.day_number > 0 and self.start_date.weekday() == self.day_index:
+            step = 7 * self.day_number
+            yield from self.get_stride_dates(self.start_date, step, start, end)
+
 
 class EveryMondayPattern(EveryDayOfWeek):
     """
@@ -339,6 +470,13 @@ class EveryWeekdayPattern(BasicPattern):
     def match_date(self, date: datetime.date) -> bool:
         return 0 <= date.weekday() <= 4 and self.match_start_date(date)
 
+    def occurrences(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterator[datetime.date]:
+        for date in self.get_dates(self.get_first_date(start), end):
+            if date.weekday() <= 4:
+                yield date
+
 
 class EveryMonthPattern(BasicPattern):
     """
@@ -360,6 +498,8 @@ class EveryMonthPattern(BasicPattern):
         self.day = None
 
     def parse(self):
+        super().parse()
+
         regexp_1 = "every month, ([0-9]+|last) day.*"
         regexp_2 = "every month, day ([0-9]+).*"
 
@@ -369,20 +509,39 @@ class EveryMonthPattern(BasicPattern):
             groups = re.match(regexp_2, self.line, flags=re.IGNORECASE)
 
         if groups is not None:
-            self.day = groups[1]
+            day = groups[1].lower()
+            self.day = day if day == "last" else int(day)
 
     def match_line(self) -> bool:
         return self.day is not None
 
     def match_date(self, date: datetime.date) -> bool:
-        date_day_number = int(date.strftime("%d"))
-
         if self.day == "last":
             task_day_number = utils.get_month_last_day_date(date).day
         else:
-            task_day_number = int(self.day)
+            task_day_number = self.day
 
-        return date_day_number == task_day_number and self.match_start_date(date)
+        return date.day == task_day_number and self.match_start_date(date)
+
+    def occurrences(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterator[datetime.date]:
+        first = self.get_first_date(start)
+
+        year = first.year
+        month = first.month
+
+        while (year, month) <= (end.year, end.month):
+            days_number = calendar.monthrange(year, month)[1]
+            day = days_number if self.day == "last" else self.day
+
+            if 1 <= day <= days_number:
+                date = datetime.date(year, month, day)
+
+                if first <= date <= end:
+                    yield date
+
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
 
 
 class EveryYearPattern(BasicPattern):
@@ -401,6 +560,8 @@ class EveryYearPattern(BasicPattern):
         self.month = None
 
     def parse(self):
+        super().parse()
+
         day_regexp = "[0-9]{1,2}"
         month_regexp = "jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec"
 
@@ -413,16 +574,6 @@ class EveryYearPattern(BasicPattern):
             groups = re.match(regexp_2, self.line, flags=re.IGNORECASE)
 
         if groups is not None:
-            self.day = groups["d"]
-            self.month = groups["m"]
-
-    def match_line(self) -> bool:
-        return self.day is not None and self.month is not None
-
-    def match_date(self, date: datetime.date) -> bool:
-        result = False
-
-        if self.match_start_date(date):
             months = {
                 "jan": 1,
                 "feb": 2,
@@ -438,54 +589,93 @@ class EveryYearPattern(BasicPattern):
                 "dec": 12,
             }
 
-            day_number = int(self.day)
-            month_number = months.get(self.month)
+            self.day = int(groups["d"])
+            self.month = months.get(groups["m"].lower())
 
-            result = date.day == day_number and date.month == month_number
+    def match_line(self) -> bool:
+        return self.day is not None and self.month is not None
 
-        return result
+    def match_date(self, date: datetime.date) -> bool:
+        return (
+            date.day == self.day
+            and date.month == self.month
+            and self.match_start_date(date)
+        )
+
+    def occurrences(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterator[datetime.date]:
+        first = self.get_first_date(start)
+
+        for year in range(first.year, end.year + 1):
+            try:
+                date = datetime.date(year, self.month, self.day)
+            except ValueError:
+                continue
+
+            if first <= date <= end:
+                yield date
 
 
 def match(plan: plan_todo.PlanTodo, date: datetime.date) -> tuple:
-    matched_pattern = Pattern.NONE
-    is_date_matched = False
+    rule = get_rule(plan)
 
-    logging.debug(
-        'Attempt to match pattern for "%s" on %s',
-        str(plan),
-        utils.get_string_from_date(date),
-    )
+    return rule.name, rule.match_date(date)
 
-    if plan.pattern == "":
-        logging.debug("Pattern text is not found.")
-    else:
-        pattern_text = get_compiled_pattern(plan.pattern)
 
-        logging.debug("Pattern text: %s (compiled: %s)", plan.pattern, pattern_text)
-        logging.debug("Matching the pattern...")
+def occurrences(
+    plan: plan_todo.PlanTodo, start: datetime.date, end: datetime.date
+) -> Iterator[datetime.date]:
+    """
+    Yields dates from start to end (both inclusive) the plan is scheduled for.
+    """
+
+    return get_rule(plan).occurrences(start, end)
 
-        for pattern in get_patterns():
-            logging.debug('Checking a pattern: "%s"...', pattern.name)
 
-            pattern_object = pattern(pattern_text)
-            pattern_object.parse()
+def get_rule(plan: plan_todo.PlanTodo) -> BasicPattern:
+    """
+    Returns the plan's rule. The plan's pattern is compiled on the first call only,
+    so the rule is reused for any number of dates to match.
+    """
+
+    # Reading the pattern resets the rule in case the plan's lines have been changed.
+    pattern = plan.pattern
+
+    if plan.rule is None:
+        plan.rule = make_rule(pattern)
 
-            line_matched = pattern_object.match_line()
+    return plan.rule
 
-            if line_matched:
-                logging.debug("Line is matched!")
 
-                matched_pattern = pattern_object.name
-                is_date_matched = pattern_object.match_date(date)
+def make_rule(pattern: str) -> BasicPattern:
+    """
+    Compiles a pattern text into a rule (an object of the first pattern class
+    which is able to recognize the text).
+    """
+
+    rule = BasicPattern(pattern)
 
-                if is_date_matched:
-                    logging.debug("Date is matched!")
-                else:
-                    logging.debug("Date is not matched.")
+    logging.debug('Attempt to compile pattern "%s"', pattern)
 
+    if pattern == "":
+        logging.debug("Pattern text is not found.")
+    else:
+        pattern_text = get_compiled_pattern(pattern)
+
+        logging.debug("Pattern text: %s (compiled: %s)", pattern, pattern_text)
+
+        for pattern_class in get_patterns():
+            pattern_object = pattern_class(pattern_text)
+            pattern_object.parse()
+
+            if pattern_object.match_line():
+                logging.debug('Pattern is matched: "%s"', pattern_object.name)
+
+                rule = pattern_object
                 break
 
-    return matched_pattern, is_date_matched
+    return rule
 
 
 def get_patterns() -> list:
@@ -510,43 +700,15 @@ def get_patterns() -> list:
     ]
 
 
+@functools.lru_cache(maxsize=1024)
 def get_compiled_pattern(text: str) -> str:
-    rules = [
-        (" с ", " from "),
-        ("по будням|по будним дням", "every weekday"),
-        ("будний день", "weekday"),
-        ("день", "day"),
-        (" days", " day"),
-        ("месяц", "month"),
-        ("год", "year"),
-        ("дня|дней", "days"),
-        ("последний", "last"),
-        ("каждый|каждая|каждое|каждую|каждые", "every"),
-        ("январь|января|january", "jan"),
-        ("февраль|февраля|february", "feb"),
-        ("март|марта|march", "mar"),
-        ("апрель|апреля|april", "apr"),
-        ("май|мая|may", "may"),
-        ("июнь|июня|june", "jun"),
-        ("июль|июля|july", "jul"),
-        ("август|августа|august", "aug"),
-        ("сентябрь|сентября|september", "sep"),
-        ("октябрь|октября|october", "oct"),
-        ("ноябрь|ноября|november", "nov"),
-        ("декабрь|декабря|december", "dec"),
-        ("понедельник", "monday"),
-        ("вторник", "tuesday"),
-        ("среда|среду", "wednesday"),
-        ("четверг", "thursday"),
-        ("пятница|пятницу", "friday"),
-        ("суббота|субботу", "saturday"),
-        ("воскресенье", "sunday"),
-    ]
-
-    for rule in rules:
-        source_regexp = rf"(.*)({rule[0]})(.*)"
-        result_regexp = rf"\1{rule[1]}\3"
+    """
+    Translates a pattern text to English words the pattern classes recognize,
+    in a single pass over the text. Results are cached, since plans of a file
+    share a few patterns.
+    """
 
-        text = re.sub(source_regexp, result_regexp, text, flags=re.IGNORECASE)
+    def translate(match_object: re.Match) -> str:
+        return TRANSLATIONS[match_object[0].lower()]
 
-    return text.strip()
+    return TRANSLATION_REGEXP.sub(translate, text).strip()
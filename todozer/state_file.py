@@ -1,20 +1,42 @@
 #!/usr/bin/env python3
 
-"""Methods to read and write the app's state file."""
+"""
+Methods to read and write the app's state file.
 
+The state is stored as a YAML file, while notifications triggered since it was written
+are appended to a journal next to it, one JSON line per notification, so the whole
+state is not rewritten every time a notification is sent. The journal is applied
+to the state when it is loaded and merged into the state file (compacted) when the state
+is saved as a whole, which happens when the journal becomes too large.
+"""
+
+import json
 import os
 
 import yaml
 import yaml.parser
 
-from todozer import constants, echo, utils
+# The libyaml based loader & dumper are much faster than the pure Python ones,
+# but libyaml may be not available.
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+from todozer import atomic_file, constants, echo, lock_file, profiler, utils
+
+# The journal is merged into the state file as soon as it is larger (in bytes).
+JOURNAL_MAX_SIZE = 64 * 1024
 
 
 def save_yaml(file_name: str, file_data: dict) -> None:
-    """Writes a dictionary as a YAML file."""
+    """Writes a dictionary as a YAML file, replacing the file at once."""
 
-    with open(file_name, encoding=constants.ENCODING, mode="w") as yaml_file:
-        yaml.safe_dump(file_data, yaml_file)
+    with atomic_file.open_for_writing(
+        file_name, encoding=constants.ENCODING
+    ) as yaml_file:
+        yaml.dump(file_data, yaml_file, Dumper=SafeDumper)
 
 
 def load_yaml(file_name: str) -> dict:
@@ -24,7 +46,7 @@ def load_yaml(file_name: str) -> dict:
 
     try:
         with open(file_name, encoding=constants.ENCODING) as yaml_file:
-            result = yaml.safe_load(yaml_file)
+            result = yaml.load(yaml_file, Loader=SafeLoader)
 
     except yaml.parser.ParserError:
         echo.error(f"Unable to parse {file_name}!")
@@ -46,6 +68,17 @@ def get_data_file_path(path: str) -> str:
     return filename
 
 
+def get_journal_file_path(path: str) -> str:
+    """Returns the app's journal file name."""
+
+    filename = "todozer.journal"
+
+    if path is not None:
+        filename = os.path.join(path, filename)
+
+    return filename
+
+
 def get_data_by_default() -> dict:
     """Returns default app's data."""
 
@@ -55,17 +88,107 @@ def get_data_by_default() -> dict:
     }
 
 
+@profiler.timed("state load")
 def load(path: str) -> dict:
-    """Returns the app's data."""
+    """Returns the app's data, notifications from the journal included."""
 
     file_name = get_data_file_path(path)
 
-    return load_yaml(file_name) if os.path.exists(file_name) else get_data_by_default()
+    data = load_yaml(file_name) if os.path.exists(file_name) else get_data_by_default()
+
+    for date_string, title_line, time_string in __read_journal(path):
+        add_triggered_notification(data, date_string, title_line, time_string)
+
+    return data
 
 
+@profiler.timed("save")
 def save(path: str, data: dict):
-    """Writes the app's data."""
+    """Writes the app's data as a whole, so the journal is not needed anymore."""
 
     file_name = get_data_file_path(path)
 
     save_yaml(file_name, data)
+
+    try:
+        os.remove(get_journal_file_path(path))
+    except FileNotFoundError:
+        pass
+
+
+def add_triggered_notification(
+    data: dict, date_string: str, title_line: str, time_string: str
+) -> bool:
+    """
+    Marks a notification as triggered. Returns False if it has been triggered already.
+    """
+
+    triggered_notifications = data["triggered_notifications"]
+    task_notifications = triggered_notifications.setdefault(date_string, {})
+    time_strings = task_notifications.setdefault(title_line, [])
+
+    if time_string in time_strings:
+        return False
+
+    time_strings.append(time_string)
+
+    return True
+
+
+@profiler.timed("save")
+def save_triggered_notifications(
+    path: str, notifications: list[tuple[str, str, str]]
+) -> None:
+    """
+    Appends notifications triggered, (date, task's title line, time) tuples,
+    to the journal. In case the journal is too large, it is merged into the state file.
+
+    The working directory is locked meanwhile, so the state file is not changed
+    by another process of the app at the same time. Since the state may be changed
+    by another process since it was loaded, it is loaded again to merge the journal.
+    """
+
+    file_name = get_journal_file_path(path)
+
+    with lock_file.lock(path):
+        with open(file_name, "a+b") as journal_file:
+            # A line which is not written completely (if the app was stopped
+            # while writing it) is ended, so the next line is not glued to it.
+            if journal_file.tell() > 0:
+                journal_file.seek(-1, os.SEEK_END)
+
+                if journal_file.read(1) != b"\n":
+                    journal_file.write(b"\n")
+
+            for notification in notifications:
+                line = json.dumps(notification, ensure_ascii=False)
+                journal_file.write(f"{line}\n".encode(constants.ENCODING))
+
+        if os.path.getsize(file_name) > JOURNAL_MAX_SIZE:
+            save(path, load(path))
+
+
+def __read_journal(path: str) -> list:
+    """
+    Returns notifications recorded in the journal. A line which is not written
+    completely (if the app was stopped while writing it) is skipped.
+    """
+
+    notifications = []
+
+    try:
+        with open(
+            get_journal_file_path(path), encoding=constants.ENCODING
+        ) as journal_file:
+            for line in journal_file:
+                try:
+                    date_string, title_line, time_string = json.loads(line)
+                except (ValueError, TypeError):
+                    continue
+
+                notifications.append((date_string, title_line, time_string))
+
+    except FileNotFoundError:
+        pass
+
+    return notifications
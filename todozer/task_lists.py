@@ -1,55 +1,173 @@
 #!/usr/bin/env python3
 
 import os
-import shutil
 
 """Methods to work with task lists in tasks file & plans file."""
 
+import collections
 import configparser
 import datetime
 
-from todozer import constants, parser, scheduler, utils
+from todozer import (
+    atomic_file,
+    cache_file,
+    constants,
+    parser,
+    plan_calendar,
+    profiler,
+    tasks_file,
+    utils,
+)
 from todozer.todo import list_todo, plan_todo, task_todo
 
+# The largest number of dates to keep planned tasks for (see get_planned_tasks).
+PLANNED_TASKS_CACHE_SIZE = 512
 
+# Planned tasks by plans' fingerprints and dates, the least recently used first.
+__planned_tasks: collections.OrderedDict = collections.OrderedDict()
+
+
+@profiler.timed("save")
 def save_tasks_file_items(
     tasks_file_items: list, config: configparser.ConfigParser, path: str | None
 ):
-    content = []
+    """
+    Writes items to the tasks file, sorted by their dates.
+
+    Task lists which have not been changed since they were read from the file
+    (see tasks_file.TasksFile) are copied as they are, without converting them
+    back to text. The file is written by means of atomic_file, so it is never left
+    partially written, and its backup (if required) is made without copying it.
+    """
 
-    tasks_file_items = sorted(
+    tasks_file_items_sorted = sorted(
         tasks_file_items,
         key=lambda item: item.date,
         reverse=bool(config.getboolean("TASKS", "reverse_days_order")),
     )
 
-    for tasks_file_item in tasks_file_items:
-        content.append(str(tasks_file_item))
-
     tasks_file_name = config.get("TASKS", "file_name")
 
     if path is not None:
         tasks_file_name = os.path.join(path, tasks_file_name)
 
+    file_stat = utils.get_file_stat(tasks_file_name)
+
+    sections = None
+
+    if type(tasks_file_items) == tasks_file.TasksFile:
+        sections = tasks_file_items
+
+    backup_tasks_file_name = None
+
     if bool(config.getboolean("TASKS", "make_backup")):
-        backup_tasks_file_name = f"{tasks_file_name}.bak"
-        shutil.copyfile(tasks_file_name, backup_tasks_file_name, follow_symlinks=True)
+        backup_tasks_file_name = f"{os.path.realpath(tasks_file_name)}.bak"
+
+    with atomic_file.open_for_writing(
+        tasks_file_name, binary=True, backup_file_name=backup_tasks_file_name
+    ) as output_file:
+        __write_tasks_file_items(
+            output_file, tasks_file_name, tasks_file_items_sorted, sections, file_stat
+        )
+
+
+def __write_tasks_file_items(
+    output_file,
+    tasks_file_name: str,
+    tasks_file_items: list,
+    sections: tasks_file.TasksFile | None,
+    file_stat: tuple | None,
+) -> None:
+    input_file = None
+
+    try:
+        for number, tasks_file_item in enumerate(tasks_file_items):
+            if number > 0:
+                output_file.write(os.linesep.encode(constants.ENCODING) * 2)
+
+            span = None
+
+            if sections is not None and type(tasks_file_item) == list_todo.ListTodo:
+                span = sections.get_section(tasks_file_item, file_stat)
+
+            if span is None:
+                content = str(tasks_file_item).replace("\n", os.linesep)
+                output_file.write(content.encode(constants.ENCODING))
+
+            else:
+                if input_file is None:
+                    input_file = open(tasks_file_name, "rb")
+
+                input_file.seek(span[0])
+                output_file.write(input_file.read(span[1] - span[0]))
+
+    finally:
+        if input_file is not None:
+            input_file.close()
+
+
+@profiler.timed("tasks parse")
+def load_tasks_file_items(
+    config: configparser.ConfigParser, path: str
+) -> tasks_file.TasksFile:
+    """
+    Loads all the items of the tasks file, remembering ranges of bytes
+    task lists are read from, so the unchanged ones can be saved without
+    converting them back to text.
+    """
 
-    with open(tasks_file_name, "w", encoding=constants.ENCODING) as tasks_file:
-        tasks_file.write("\n\n".join(content))
+    tasks_file_name = config.get("TASKS", "file_name")
+
+    if path is not None:
+        tasks_file_name = os.path.join(path, tasks_file_name)
+
+    file_stat = utils.get_file_stat(tasks_file_name)
+
+    tasks_file_items = []
+    sections = {}
+
+    tasks_file_parser = parser.Parser(tasks_file_name, task_todo.TaskTodo)
+
+    for tasks_file_item, span in tasks_file_parser.parse_sections():
+        tasks_file_items.append(tasks_file_item)
+
+        if span is not None and type(tasks_file_item) == list_todo.ListTodo:
+            sections[tasks_file_item] = span
+
+    return tasks_file.TasksFile(
+        sorted(tasks_file_items, key=lambda item: item.date), file_stat, sections
+    )
 
 
-def load_tasks_file_items(config: configparser.ConfigParser, path: str):
+@profiler.timed("tasks parse")
+def load_tasks_file_lists(
+    config: configparser.ConfigParser,
+    path: str,
+    start: datetime.date,
+    end: datetime.date,
+) -> tasks_file.TasksFile:
+    """
+    Loads task lists dated within a period (both dates are inclusive) only,
+    which is much faster than loading the whole file when the period is short.
+
+    The lists are found using an index of the file's sections, which is cached
+    next to the app's data file, so an unchanged file is not even read in full.
+    """
+
     tasks_file_name = config.get("TASKS", "file_name")
 
     if path is not None:
         tasks_file_name = os.path.join(path, tasks_file_name)
 
-    tasks_file_items = parser.Parser(tasks_file_name, task_todo.TaskTodo).parse()
+    index = cache_file.get(path, tasks_file_name, parser.get_sections_index)
+
+    tasks_file_parser = parser.Parser(tasks_file_name, task_todo.TaskTodo)
+    tasks_file_items = tasks_file_parser.sections(start, end, index)
 
-    return sorted(tasks_file_items, key=lambda item: item.date)
+    return tasks_file.TasksFile(sorted(tasks_file_items, key=lambda item: item.date))
 
 
+@profiler.timed("plans parse")
 def load_plans_file_items(config: configparser.ConfigParser, path: str):
     plans_file_name = config.get("PLANS", "file_name")
 
@@ -76,7 +194,10 @@ def get_task_lists_in_progress(file_items: list) -> list:
     return dates_in_progress
 
 
-def fill_tasks_lists(task_items: list, plan_items: list, data: dict) -> list:
+@profiler.timed("scheduling")
+def fill_tasks_lists(
+    task_items: list, plans: plan_calendar.PlanCalendar, data: dict
+) -> list:
     filled_list_titles = []
 
     today = utils.get_date_of_today()
@@ -89,44 +210,58 @@ def fill_tasks_lists(task_items: list, plan_items: list, data: dict) -> list:
         )
 
         if is_list_to_fill:
-            fill_tasks_list(task_item, plan_items)
+            fill_tasks_list(task_item, plans)
 
             filled_list_titles.append(task_item.title)
 
     return filled_list_titles
 
 
+@profiler.timed("scheduling")
 def fill_tasks_list(
-    tasks_file_item: list_todo.ListTodo, plans_file_items: list
+    tasks_file_item: list_todo.ListTodo, plans: plan_calendar.PlanCalendar
 ) -> None:
-    for plans_file_item in plans_file_items:
-        if isinstance(plans_file_item, list_todo.ListTodo):
-            fill_tasks_list(tasks_file_item, plans_file_item.items)
+    tasks_file_item.items.extend(get_planned_tasks(plans, tasks_file_item.date))
+    tasks_file_item.sort_tasks()
 
-        elif isinstance(plans_file_item, plan_todo.PlanTodo):
-            _, is_date_matched = scheduler.match(plans_file_item, tasks_file_item.date)
 
-            if is_date_matched:
-                line = f"- [ ] {plans_file_item.title}"
-                task = task_todo.TaskTodo(line)
+def get_planned_tasks(
+    plans: plan_calendar.PlanCalendar, date: datetime.date
+) -> list[task_todo.TaskTodo]:
+    """
+    Returns new tasks made of the plans scheduled for a date.
 
-                if len(plans_file_item.lines) > 1:
-                    i = 0
+    The tasks are kept in a bounded LRU cache by the plans' fingerprint, so the same
+    date of the same plans (e.g. when the notifier reloads the tasks file) is planned
+    once, and then the tasks are just copied, along with values parsed from them.
+    """
 
-                    for plan_line in plans_file_item.lines:
-                        i += 1
+    # Rules of some patterns depend on the current date, so it is a part of the key.
+    key = (plans.fingerprint, utils.get_date_of_today(), date)
+    tasks = __planned_tasks.get(key)
 
-                        if i == 1:
-                            continue
+    if tasks is None:
+        tasks = []
 
-                        task.lines.append(plan_line)
+        for plan in plans.get_plans(date):
+            task = task_todo.TaskTodo(f"- [ ] {plan.title}")
+            task.lines.extend(plan.lines[1:])
+            task.parse()
 
-                tasks_file_item.items.append(task)
+            tasks.append(task)
 
-    tasks_file_item.sort_tasks()
+        __planned_tasks[key] = tasks
+
+        if len(__planned_tasks) > PLANNED_TASKS_CACHE_SIZE:
+            __planned_tasks.popitem(last=False)
 
+    else:
+        __planned_tasks.move_to_end(key)
 
-def add_tasks_lists(tasks: list, last_date: datetime.date) -> None:
+    return [task.copy() for task in tasks]
+
+
+def add_tasks_lists(tasks: tasks_file.TasksFile, last_date: datetime.date) -> None:
     date = utils.get_date_of_tomorrow(last_date)
     today = utils.get_date_of_today()
 
@@ -140,13 +275,6 @@ def add_tasks_lists(tasks: list, last_date: datetime.date) -> None:
 
 
 def get_tasks_list_by_date(
-    tasks: list, date: datetime.date
+    tasks: tasks_file.TasksFile, date: datetime.date
 ) -> list_todo.ListTodo | None:
-    # TODO probably better to do it like .is_date (duck typing)
-    lists = list(
-        filter(
-            lambda item: type(item) is list_todo.ListTodo and item.date == date, tasks
-        )
-    )
-
-    return lists[0] if lists else None
+    return tasks.get_list(date)
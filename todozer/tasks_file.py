@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+"""A model of a tasks file, which allows to find a task list by its date at once."""
+
+import datetime
+
+from todozer.todo import list_todo
+
+
+class TasksFile:
+    """
+    Items of a tasks file with an index of task lists by their dates.
+
+    The index is kept up to date when an item is appended, so items must be added
+    using the append() method only.
+
+    In case the items are read from a file, ranges of bytes their sections occupy
+    in the file may be given, so the unchanged sections can be copied from the file
+    as they are when the items are saved (see get_section).
+    """
+
+    __items: list
+    __lists_by_date: dict
+    __file_stat: tuple | None
+    __sections: dict
+
+    def __init__(
+        self,
+        items: list | None = None,
+        file_stat: tuple | None = None,
+        sections: dict | None = None,
+    ):
+        self.__items = []
+        self.__lists_by_date = {}
+        self.__file_stat = file_stat
+        self.__sections = {}
+
+        for item in items or []:
+            self.append(item)
+
+        for item, span in (sections or {}).items():
+            self.__sections[item] = (span, self.__get_snapshot(item))
+
+    def __iter__(self):
+        return iter(self.__items)
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __getitem__(self, index):
+        return self.__items[index]
+
+    def append(self, item) -> None:
+        """
+        Adds an item to the end of the file and indexes it in case it is a dated task list.
+        """
+
+        self.__items.append(item)
+
+        if isinstance(item, list_todo.ListTodo):
+            date = item.date
+
+            if date is not None:
+                self.__lists_by_date.setdefault(date, item)
+
+    def get_list(self, date: datetime.date) -> list_todo.ListTodo | None:
+        """
+        Returns the (first) task list of a date, if there is one.
+        """
+
+        return self.__lists_by_date.get(date)
+
+    def get_section(
+        self, item: list_todo.ListTodo, file_stat: tuple | None
+    ) -> tuple[int, int] | None:
+        """
+        Returns a range of bytes of the file which a task list is read from, in case
+        neither the list has been changed since then, nor the file (its current state,
+        returned by utils.get_file_stat(), is given).
+        """
+
+        result = None
+
+        if file_stat is not None and file_stat == self.__file_stat:
+            span, snapshot = self.__sections.get(item, (None, None))
+
+            if span is not None and snapshot == self.__get_snapshot(item):
+                result = span
+
+        return result
+
+    @staticmethod
+    def __get_snapshot(item: list_todo.ListTodo) -> tuple:
+        return tuple(item.lines), tuple(tuple(task.lines) for task in item.items)
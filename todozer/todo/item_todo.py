@@ -1,14 +1,105 @@
 """Contains a basic class of items to do."""
 
+import copy
+import functools
 import re
 
+# A marker of a cached value which has not been parsed yet.
+NOT_PARSED = object()
+
+
+class Lines(list):
+    """
+    Lines of an item, which make the item forget values parsed from them
+    whenever they are changed.
+    """
+
+    __slots__ = ("__item",)
+
+    def __init__(self, item: "ItemTodo", lines) -> None:
+        super().__init__(lines)
+        self.__item = item
+
+    def __reduce__(self):
+        # Lines are pickled (or copied) as a plain list, without their item.
+        return list, (list(self),)
+
+    def _changed(self) -> None:
+        self.__item._reset_parsed()
+
+
+# Methods of a list which change it.
+CHANGING_METHODS = (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+)
+
+
+def __make_changing(method):
+    @functools.wraps(method)
+    def changing(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+
+        return result
+
+    return changing
+
+
+for method_name in CHANGING_METHODS:
+    setattr(Lines, method_name, __make_changing(getattr(list, method_name)))
+
 
 class ItemTodo:
-    """A basic class of items to do."""
+    """
+    A basic class of items to do.
+
+    Values parsed from the item's lines are cached until the lines are changed:
+    a cached property parses its value only if it is NOT_PARSED, and the values
+    are reset to NOT_PARSED by _reset_parsed() whenever the lines are changed
+    or replaced (see Lines).
+    """
+
+    __slots__ = ("__lines",)
 
     def __init__(self, line: str) -> None:
         self.lines = [line]
 
+    @property
+    def lines(self) -> list[str]:
+        return self.__lines
+
+    @lines.setter
+    def lines(self, lines: list[str]) -> None:
+        self.__lines = Lines(self, lines)
+        self._reset_parsed()
+
+    def copy(self):
+        """
+        Returns a copy of the item with a list of lines of its own. Values parsed
+        from the lines already are copied as well, so they are not parsed again.
+        """
+
+        result = copy.copy(self)
+        result.__lines = Lines(result, self.__lines)
+
+        return result
+
+    def _reset_parsed(self) -> None:
+        """
+        Forgets values parsed from the item's lines.
+        """
+
     def __str__(self) -> str:
         """
         Return all the lines of item, separated with line breaks.
@@ -11,10 +11,16 @@ from todozer.todo import item_todo, task_todo
 class ListTodo(item_todo.ItemTodo):
     """Tasks collection class."""
 
+    __slots__ = ("items", "__date")
+
     def __init__(self, line: str):
         super().__init__(line)
         self.items = []
 
+    def _reset_parsed(self) -> None:
+        super()._reset_parsed()
+        self.__date = item_todo.NOT_PARSED
+
     def __str__(self) -> str:
         """
         Returns all the lines of the item (its own title in most cases),
@@ -53,6 +59,12 @@ class ListTodo(item_todo.ItemTodo):
         Return a date of the list, if it is possible to determine using the ISO standard.
         """
 
+        if self.__date is item_todo.NOT_PARSED:
+            self.__date = self.__parse_date()
+
+        return self.__date
+
+    def __parse_date(self) -> datetime.date | None:
         result = None
 
         if self.lines[0]:
@@ -1,24 +1,41 @@
-from todozer.todo import task_todo
+from todozer.todo import item_todo, task_todo
 
 
 class PlanTodo(task_todo.TaskTodo):
     """A single plan class."""
 
+    __slots__ = ("rule", "__title", "__pattern")
+
+    def _reset_parsed(self) -> None:
+        super()._reset_parsed()
+
+        # The plan's pattern compiled by the scheduler (see scheduler.get_rule).
+        self.rule = None
+
+        self.__title = item_todo.NOT_PARSED
+        self.__pattern = item_todo.NOT_PARSED
+
     @property
     def title(self) -> str:
-        result = super().title
-        index = result.rfind(";")
+        if self.__title is item_todo.NOT_PARSED:
+            result = super().title
+            index = result.rfind(";")
+
+            if index != -1:
+                result = result[:index]
 
-        if index != -1:
-            result = result[:index]
+            self.__title = result
 
-        return result
+        return self.__title
 
     @property
     def pattern(self) -> str:
-        title = super().title
-        index = title.rfind(";")
+        if self.__pattern is item_todo.NOT_PARSED:
+            title = super().title
+            index = title.rfind(";")
+
+            next_index = index + 1
 
-        next_index = index + 1
+            self.__pattern = title[next_index:].strip() if index != -1 else ""
 
-        return title[next_index:].strip() if index != -1 else ""
+        return self.__pattern
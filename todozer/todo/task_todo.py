@@ -7,12 +7,50 @@ from todozer.todo import item_todo
 class TaskTodo(item_todo.ItemTodo):
     """A single task class."""
 
+    __slots__ = (
+        "__title",
+        "__time_string",
+        "__time",
+        "__is_scheduled",
+        "__is_completed",
+        "__notifications",
+        "__timer",
+    )
+
+    def _reset_parsed(self) -> None:
+        super()._reset_parsed()
+
+        self.__title = item_todo.NOT_PARSED
+        self.__time_string = item_todo.NOT_PARSED
+        self.__time = item_todo.NOT_PARSED
+        self.__is_scheduled = item_todo.NOT_PARSED
+        self.__is_completed = item_todo.NOT_PARSED
+        self.__notifications = item_todo.NOT_PARSED
+        self.__timer = item_todo.NOT_PARSED
+
+    def parse(self) -> None:
+        """
+        Parses the values required to sort tasks and to notify about them in advance,
+        so copies of the task made afterwards (see copy) share them.
+        """
+
+        self.__title = self.title
+        self.__time = self.time
+        self.__is_scheduled = self.is_scheduled
+        self.__notifications = self.notifications
+
     @property
     def title(self) -> str:
         """
         Returns the task's title (first line without markers) (-, +, []).
         """
 
+        if self.__title is item_todo.NOT_PARSED:
+            self.__title = self.__parse_title()
+
+        return self.__title
+
+    def __parse_title(self) -> str:
         result = super().title
 
         if result.startswith("-"):
@@ -27,9 +65,13 @@ class TaskTodo(item_todo.ItemTodo):
 
     @property
     def time(self) -> datetime.time:
-        time_string = self.get_time_string()
+        if self.__time is item_todo.NOT_PARSED:
+            time_string = self.get_time_string()
+            self.__time = datetime.time.fromisoformat(
+                time_string if time_string else "00:00"
+            )
 
-        return datetime.time.fromisoformat(time_string if time_string else "00:00")
+        return self.__time
 
     @property
     def has_time(self) -> bool:
@@ -40,9 +82,13 @@ class TaskTodo(item_todo.ItemTodo):
         return len(self.get_time_string()) > 0
 
     def get_time_string(self) -> str:
-        matches = re.findall(r"\b(?:[01][0-9]|2[0-3]|[0-9]):[0-5][0-9]\b", self.title)
+        if self.__time_string is item_todo.NOT_PARSED:
+            regexp = r"\b(?:[01][0-9]|2[0-3]|[0-9]):[0-5][0-9]\b"
+            matches = re.findall(regexp, self.title)
 
-        return matches[0] if matches else ""
+            self.__time_string = matches[0] if matches else ""
+
+        return self.__time_string
 
     @staticmethod
     def get_notification_1(line: str) -> dict | None:
@@ -76,12 +122,15 @@ class TaskTodo(item_todo.ItemTodo):
 
     @property
     def notifications(self) -> list:
-        notifications = []
+        if self.__notifications is item_todo.NOT_PARSED:
+            notifications = []
 
-        for line in self.lines:
-            self.add_notifications_by_line(notifications, line)
+            for line in self.lines:
+                self.add_notifications_by_line(notifications, line)
 
-        return notifications
+            self.__notifications = notifications
+
+        return self.__notifications
 
     @staticmethod
     def add_notifications_by_line(notifications: list, line: str) -> None:
@@ -147,6 +196,12 @@ class TaskTodo(item_todo.ItemTodo):
 
     @property
     def timer(self) -> dict:
+        if self.__timer is item_todo.NOT_PARSED:
+            self.__timer = self.__parse_timer()
+
+        return self.__timer
+
+    def __parse_timer(self) -> dict:
         seconds = 0
 
         for line in self.lines:
@@ -179,15 +234,25 @@ class TaskTodo(item_todo.ItemTodo):
 
     @property
     def is_scheduled(self) -> bool:
-        return (
-            TaskTodo.is_scheduled_task(self.lines[0]) if len(self.lines) > 0 else False
-        )
+        if self.__is_scheduled is item_todo.NOT_PARSED:
+            self.__is_scheduled = (
+                TaskTodo.is_scheduled_task(self.lines[0])
+                if len(self.lines) > 0
+                else False
+            )
+
+        return self.__is_scheduled
 
     @property
     def is_completed(self) -> bool:
-        return (
-            TaskTodo.is_completed_task(self.lines[0]) if len(self.lines) > 0 else False
-        )
+        if self.__is_completed is item_todo.NOT_PARSED:
+            self.__is_completed = (
+                TaskTodo.is_completed_task(self.lines[0])
+                if len(self.lines) > 0
+                else False
+            )
+
+        return self.__is_completed
 
     @staticmethod
     def is_scheduled_task(line) -> bool:
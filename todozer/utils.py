@@ -5,7 +5,7 @@ import datetime
 import logging
 import os
 
-from todozer import constants
+from todozer import constants, profiler
 
 
 def get_date_from_string(source: str) -> datetime.date:
@@ -72,6 +72,21 @@ def get_next_day_of_week(day_index: int, date: datetime.date = None) -> datetime
     return next_day
 
 
+def get_file_stat(file_name: str) -> tuple | None:
+    """
+    Returns values which change whenever a file is changed or replaced,
+    or None if there is no such file.
+    """
+
+    try:
+        stat = os.stat(file_name)
+    except FileNotFoundError:
+        return None
+
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+@profiler.timed("config load")
 def get_config(path: str) -> configparser.ConfigParser:
     config = configparser.ConfigParser()
 
@@ -86,9 +101,13 @@ def get_config(path: str) -> configparser.ConfigParser:
         },
         "LOG": {"write_log": False, "file_name": "todozer.log", "file_mode": "w"},
         "NOTIFICATIONS": {
+            "backend": "telegram",
             "future_days_number": 7,
             "telegram_bot_api_token": "",
             "telegram_chat_id": "",
+            "max_message_length": 4096,
+            "webhook_url": "",
+            "sink_file_name": "notifications.jsonl",
         },
     }
 
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+"""A watcher of data files, which allows to wait for their changes without polling them."""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import time
+
+from todozer import utils
+
+# How often files are checked when there is no way to be notified of their changes.
+POLL_INTERVAL = 2.0
+
+# Events in a directory which may mean a file in it is changed: it is modified,
+# written & closed, created, deleted, renamed or its attributes are changed.
+INOTIFY_MASK = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200
+
+
+class FileWatcher:
+    """
+    Watches files for changes.
+
+    On Linux, inotify is used to be woken up by events in the directories of the files,
+    since editors often replace a file instead of writing it. Otherwise, the files are
+    checked every POLL_INTERVAL seconds. In both cases, a file is considered changed
+    only if its modification time, size or inode is changed, so unrelated events
+    in the same directory are ignored. Files are polled on Linux as well,
+    in case inotify is not to be used.
+    """
+
+    __file_names: list
+    __file_stats: list
+    __inotify: int | None
+
+    def __init__(self, file_names: list[str], use_inotify: bool = True):
+        self.__file_names = list(file_names)
+        self.__file_stats = self.__get_file_stats()
+        self.__inotify = self.__start_inotify() if use_inotify else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.__inotify is not None:
+            os.close(self.__inotify)
+            self.__inotify = None
+
+    def refresh(self) -> None:
+        """
+        Forgets changes made so far (by the app itself, for instance).
+        """
+
+        self.__file_stats = self.__get_file_stats()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits until any of the files is changed, but no longer than the timeout
+        (in seconds), if it is given. Returns True if a file is changed.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while not self.__check_files():
+            timeout = self.__get_timeout(deadline)
+
+            if timeout == 0:
+                return False
+
+            if self.__inotify is None:
+                time.sleep(timeout)
+
+            elif select.select([self.__inotify], [], [], timeout)[0]:
+                self.__read_events()
+
+        return True
+
+    async def wait_async(self, timeout: float | None = None) -> bool:
+        """
+        The same as wait(), but lets other tasks of an event loop run while waiting.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while not self.__check_files():
+            timeout = self.__get_timeout(deadline)
+
+            if timeout == 0:
+                return False
+
+            if self.__inotify is None:
+                await asyncio.sleep(timeout)
+
+            else:
+                await self.__wait_for_events_async(timeout)
+
+        return True
+
+    def __check_files(self) -> bool:
+        file_stats = self.__get_file_stats()
+        is_changed = file_stats != self.__file_stats
+
+        self.__file_stats = file_stats
+
+        return is_changed
+
+    def __get_file_stats(self) -> list:
+        return [utils.get_file_stat(file_name) for file_name in self.__file_names]
+
+    def __get_timeout(self, deadline: float | None) -> float | None:
+        """
+        Returns how long to wait for events until the files are checked again.
+        """
+
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+
+        if self.__inotify is None:
+            timeout = POLL_INTERVAL if timeout is None else min(POLL_INTERVAL, timeout)
+
+        return timeout
+
+    async def __wait_for_events_async(self, timeout: float | None) -> None:
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+
+        loop.add_reader(self.__inotify, event.set)
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(self.__inotify)
+
+        self.__read_events()
+
+    def __read_events(self) -> None:
+        try:
+            while os.read(self.__inotify, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+    def __start_inotify(self) -> int | None:
+        libc = self.__get_libc()
+
+        if libc is None:
+            return None
+
+        inotify = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if inotify < 0:
+            logging.debug("Unable to use inotify, files will be polled")
+            return None
+
+        directories = set()
+
+        for file_name in self.__file_names:
+            directories.add(os.path.dirname(os.path.abspath(file_name)))
+            directories.add(os.path.dirname(os.path.realpath(file_name)))
+
+        for directory in directories:
+            watch = libc.inotify_add_watch(
+                inotify, os.fsencode(directory), INOTIFY_MASK
+            )
+
+            if watch < 0:
+                logging.debug("Unable to watch %s, files will be polled", directory)
+                os.close(inotify)
+                return None
+
+        return inotify
+
+    @staticmethod
+    def __get_libc() -> ctypes.CDLL | None:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        except (OSError, TypeError):
+            return None
+
+        return libc if hasattr(libc, "inotify_init1") else None